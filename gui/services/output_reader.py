@@ -1,9 +1,10 @@
 """Output Reader - Reads and parses pipeline output files."""
 
 import csv
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 
 @dataclass
@@ -102,23 +103,47 @@ class OutputReader:
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
+        # Split off the header while parsing, so the data rows are not copied
         with open(file_path, "r", encoding="utf-8", newline="") as f:
             reader = csv.reader(f)
+            headers = next(reader, None)
             rows = list(reader)
 
-        if not rows:
+        if headers is None:
             return CSVData(headers=[], rows=[], file_path=file_path)
 
-        return CSVData(headers=rows[0], rows=rows[1:], file_path=file_path)
+        return CSVData(headers=headers, rows=rows, file_path=file_path)
 
-    def find_complete_analyses(self) -> list[str]:
-        producer_path = self.output_path / "producer"
-        consumer_path = self.output_path / "consumer"
-        metrics_path = self.output_path / "metrics"
-        
-        producer = {d.name.split("_")[-1] for d in producer_path.iterdir()} if producer_path.exists() else set()
-        consumer = {d.name.split("_")[-1] for d in consumer_path.iterdir()} if consumer_path.exists() else set()
-        metrics = {d.name.split("_")[-1] for d in metrics_path.iterdir()} if metrics_path.exists() else set()
+    def iter_rows(self, file_path: Path) -> Iterator[List[str]]:
+        """Stream the data rows of a CSV file, skipping the header.
+
+        Unlike load_csv, only one row is held in memory at a time, so large
+        output files can be processed incrementally.
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
 
+        return self._stream_rows(file_path)
+
+    @staticmethod
+    def _stream_rows(file_path: Path) -> Iterator[List[str]]:
+        with open(
+            file_path, "r", encoding="utf-8", newline="", buffering=1 << 20
+        ) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            yield from reader
+
+    def _analysis_ids(self, category: str) -> set[str]:
+        """Return the analysis IDs of the entries of one category directory."""
+        try:
+            with os.scandir(self.output_path / category) as entries:
+                return {e.name.split("_")[-1] for e in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
+    def find_complete_analyses(self) -> list[str]:
         # Return analysis IDs where at least one of producer, consumer, or metrics exists
-        return sorted(producer | consumer | metrics)
+        return sorted(set().union(*map(self._analysis_ids, self.CATEGORIES)))
@@ -44,6 +44,17 @@ class MLAnalyzer(ABC):
         self.keyword_strategy = keyword_strategy or DefaultKeywordMatcher()
         self.project_metrics = []
 
+    def _library_dict_path(self, index, project_root=None):
+        """Return the path of the library dictionary at the given index.
+
+        Dictionary paths are relative to the project root; when `project_root`
+        is given they are anchored to it instead of the working directory.
+        """
+        dict_path = self.library_dicts[index]
+        if project_root is None:
+            return dict_path
+        return os.path.join(project_root, dict_path)
+
     # SAVING CSV METRICS (METRICS ONLY)
     def _save_metrics_csv(self, output_base_path: str):
         if self.role != AnalyzerRole.METRICS:
@@ -39,8 +39,9 @@ class MLConsumerAnalyzer(MLAnalyzer):
 
     def check_library(self, file, **kwargs):
         """Override check_library for MLConsumerAnalyzer """
-        consumer_library = self.library_dicts[0]
-        producer_library = self.library_dicts[1]
+        project_root = kwargs.get("project_root")
+        consumer_library = self._library_dict_path(0, project_root)
+        producer_library = self._library_dict_path(1, project_root)
         rules_3 = kwargs.get("rules_3", False)
 
         list_load_keywords = []
@@ -13,7 +13,7 @@ class MLProducerAnalyzer(MLAnalyzer):
 
     def check_library(self, file, **kwargs):
         """Check ML usage in a file using only the producer library."""
-        producer_library = self.library_dicts[0]
+        producer_library = self._library_dict_path(0, kwargs.get("project_root"))
         list_load_keywords = []
         keywords = []
 
@@ -0,0 +1,11 @@
+"""Shared pytest configuration for the MARK 2.0 test suite.
+
+Run pytest from the project root so that this conftest is picked up."""
+
+import os
+import sys
+
+# Make the project packages (gui, modules, ...) importable from every test module
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
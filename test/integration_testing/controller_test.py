@@ -3,12 +3,10 @@ import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
-import sys
 import os
 
-# Add project root to path
+# Project root (sys.path is set up in test/conftest.py)
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, project_root)
 
 from gui.controller import AppController
 from gui.services.output_reader import OutputReader
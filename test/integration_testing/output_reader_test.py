@@ -1,13 +1,7 @@
 import unittest
-import tempfile
-import shutil
 from pathlib import Path
-import sys
-import os
 
-# Add project root to path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, project_root)
+import pytest
 
 from gui.services.output_reader import OutputReader, CSVData, OutputTree
 
@@ -15,19 +9,19 @@ from gui.services.output_reader import OutputReader, CSVData, OutputTree
 class TestOutputReaderIntegration(unittest.TestCase):
     """Integration tests for OutputReader main methods."""
 
+    @pytest.fixture(autouse=True)
+    def _tmp_path(self, tmp_path):
+        """Inject pytest's tmp_path; pytest removes old ones, no tearDown needed."""
+        self.tmp_path = tmp_path
+
     def setUp(self):
         """Set up test fixtures with real directory structure."""
-        self.test_dir = Path(tempfile.mkdtemp())
+        self.test_dir = self.tmp_path
         self.output_path = self.test_dir / "output"
         self.output_path.mkdir()
 
         self.reader = OutputReader(self.output_path)
 
-    def tearDown(self):
-        """Clean up test directory."""
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
-
     # === SCAN_OUTPUT_TREE Tests ===
 
     def test_scan_output_tree_empty_directory(self):
@@ -87,6 +81,24 @@ class TestOutputReaderIntegration(unittest.TestCase):
         self.assertEqual(len(metr_dir.files), 1)
         self.assertTrue(metr_dir.files[0].is_summary)
 
+    def test_scan_output_tree_detects_new_file_in_run_dir(self):
+        """TC2b: New CSV inside an already scanned run directory → listed on rescan."""
+        # Arrange
+        run_dir = self.output_path / "producer" / "producer_1"
+        run_dir.mkdir(parents=True)
+        first = self.reader.scan_output_tree()
+        self.assertEqual(len(first.producer_dirs[0].files), 0)
+
+        (run_dir / "results.csv").write_text("ProjectName\nproj1\n")
+
+        # Act
+        second = self.reader.scan_output_tree()
+
+        # Assert
+        self.assertEqual(
+            [f.name for f in second.producer_dirs[0].files], ["results.csv"]
+        )
+
     # === LOAD_CSV Tests ===
 
     def test_load_csv_file_not_exists(self):
@@ -137,6 +149,27 @@ class TestOutputReaderIntegration(unittest.TestCase):
         self.assertEqual(csv_data.rows, [])
         self.assertEqual(csv_data.row_count, 0)
 
+    # === ITER_ROWS Tests ===
+
+    def test_iter_rows_streams_data_rows(self):
+        """TC5b: iter_rows yields the same data rows as load_csv, without the header."""
+        # Arrange
+        csv_file = self.output_path / "test.csv"
+        csv_file.write_text("ProjectName,Status\nproject_a,Success\nproject_b,Failed\n")
+
+        # Act
+        rows = self.reader.iter_rows(csv_file)
+
+        # Assert
+        self.assertEqual(next(rows), ["project_a", "Success"])
+        self.assertEqual(list(rows), [["project_b", "Failed"]])
+
+    def test_iter_rows_file_not_exists(self):
+        """TC5c: Non-existent file → raises FileNotFoundError before iterating."""
+        # Act & Assert
+        with self.assertRaises(FileNotFoundError):
+            self.reader.iter_rows(self.output_path / "missing.csv")
+
     # === FIND_COMPLETE_ANALYSES Tests ===
 
     def test_find_complete_analyses_no_directories(self):
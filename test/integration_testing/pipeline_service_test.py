@@ -1,14 +1,19 @@
+import contextlib
 import unittest
-import tempfile
 import shutil
 import os
-import sys
 import stat
 from pathlib import Path
 
-# Add project root to path
+import pytest
+
+# Project root (sys.path is set up in test/conftest.py)
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, project_root)
+
+# Percorsi sorgente risolti una sola volta all'import del modulo
+SOURCE_CSV = Path(project_root) / "io" / "applied_projects.csv"
+SOURCE_DICT = Path(project_root) / "io" / "library_dictionary"
+CLONER_LOG_PATH = Path(project_root) / "modules" / "cloner" / "log"
 
 from gui.services.pipeline_service import (
     PipelineService,
@@ -26,22 +31,94 @@ def remove_readonly(func, path, excinfo):
     func(path)
 
 
+def _link_or_copy(src, dst):
+    """
+    Crea dst come hard link di src (nessuna copia dei byte); se il link non
+    e' possibile (es. filesystem diversi) ripiega su shutil.copy2.
+    I file sorgente sono solo letti dalla pipeline, quindi condividerli e' sicuro.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _clone_tree(src, dst):
+    """
+    Clona la directory src in dst con os.scandir, collegando i file con
+    _link_or_copy invece di copiarli.
+    """
+    os.makedirs(dst)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _clone_tree(entry.path, target)
+            else:
+                _link_or_copy(entry.path, target)
+
+
+def _remove_csv_files(directory):
+    """
+    Rimuove i file .csv di directory con una sola scansione os.scandir,
+    senza creare un oggetto Path per file. Una directory assente e' ignorata.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".csv"):
+                    with contextlib.suppress(OSError):
+                        os.unlink(entry.path)
+    except FileNotFoundError:
+        pass
+
+
 def safe_rmtree(path):
     """
     Rimozione sicura di directory con gestione file read-only Windows.
+    Una directory gia' assente non e' un errore.
     """
-    if path.exists():
-        # Su Windows, i file .git possono essere read-only
+    # Nessun controllo preventivo di esistenza: rmtree segnala l'assenza
+    # con FileNotFoundError. Su Windows, i file .git possono essere read-only
+    try:
         shutil.rmtree(path, onerror=remove_readonly)
+    except FileNotFoundError:
+        pass
 
 
 class TestPipelineServiceIntegration(unittest.TestCase):
     """Integration tests for PipelineService.run_pipeline method."""
 
+    # Configurazione di base condivisa: ogni test sovrascrive solo cio' che gli serve
+    BASE_CONFIG = dict(
+        n_repos=1,
+        run_cloner=False,
+        run_cloner_check=False,
+        run_producer_analysis=False,
+        run_consumer_analysis=False,
+        run_metrics_analysis=False,
+    )
+
+    def make_config(self, **overrides):
+        """Build a PipelineConfig for this test's directories from BASE_CONFIG."""
+        kwargs = {
+            "io_path": self.io_path,
+            "repository_path": self.repos_path,
+            "project_list_path": self.test_csv,
+            **self.BASE_CONFIG,
+            **overrides,
+        }
+        return PipelineConfig(**kwargs)
+
+    @pytest.fixture(autouse=True)
+    def _tmp_path(self, tmp_path):
+        """Inject pytest's tmp_path as the per-test base directory."""
+        self.tmp_path = tmp_path
+
     def setUp(self):
         """Set up test fixtures with real directory structure."""
-        # Crea directory temporanea per ogni test
-        self.test_dir = Path(tempfile.mkdtemp())
+        # Directory temporanea per ogni test, gestita da pytest
+        self.test_dir = self.tmp_path
         self.io_path = self.test_dir / "io"
         self.io_path.mkdir()
 
@@ -53,47 +130,32 @@ class TestPipelineServiceIntegration(unittest.TestCase):
         self.output_path.mkdir()
 
         # Crea directory log per il cloner (IMPORTANTE!)
-        self.log_path = Path(project_root) / "modules" / "cloner" / "log"
+        self.log_path = CLONER_LOG_PATH
         self.log_path.mkdir(exist_ok=True)
 
-        # Copia il CSV reale nella directory di test
-        source_csv = Path(project_root) / "io" / "applied_projects.csv"
+        # Copia il CSV reale nella directory di test: e' piccolo, e un hard link
+        # esporrebbe il file versionato a eventuali scritture sulla copia
         self.test_csv = self.io_path / "applied_projects.csv"
-        shutil.copy(source_csv, self.test_csv)
+        shutil.copy2(SOURCE_CSV, self.test_csv)
 
-        # Copia dictionary se esiste
-        src_dict = Path(project_root) / "io" / "library_dictionary"
-        if src_dict.exists():
+        # Clona dictionary se esiste
+        if SOURCE_DICT.exists():
             dst_dict = self.io_path / "library_dictionary"
-            shutil.copytree(src_dict, dst_dict)
+            _clone_tree(SOURCE_DICT, dst_dict)
 
     def tearDown(self):
         """Clean up test directory and log files."""
-        # Usa la funzione safe_rmtree invece di shutil.rmtree
+        # I repository clonati possono essere grandi: rimuovili subito invece di
+        # lasciarli nelle directory temporanee conservate da pytest
         safe_rmtree(self.test_dir)
 
         # Pulisci eventuali file di log creati durante il test
-        if self.log_path.exists():
-            for file in self.log_path.glob("*.csv"):
-                try:
-                    file.unlink()
-                except Exception:
-                    pass
+        _remove_csv_files(self.log_path)
 
     def test_cloning_with_check(self):
         """Test case 1: Cloning + cloner check enabled, analysis disabled."""
         # Arrange
-        config = PipelineConfig(
-            io_path=self.io_path,
-            repository_path=self.repos_path,
-            project_list_path=self.test_csv,
-            n_repos=2,
-            run_cloner=True,
-            run_cloner_check=True,
-            run_producer_analysis=False,
-            run_consumer_analysis=False,
-            run_metrics_analysis=False,
-        )
+        config = self.make_config(n_repos=2, run_cloner=True, run_cloner_check=True)
 
         service = PipelineService(config)
 
@@ -110,13 +172,7 @@ class TestPipelineServiceIntegration(unittest.TestCase):
     def test_all_analysis_enabled_no_cloning(self):
         """Test case 2: All analysis enabled (producer, consumer, metrics), no cloning."""
         # Arrange
-        config = PipelineConfig(
-            io_path=self.io_path,
-            repository_path=self.repos_path,
-            project_list_path=self.test_csv,
-            n_repos=1,
-            run_cloner=False,
-            run_cloner_check=False,
+        config = self.make_config(
             run_producer_analysis=True,
             run_consumer_analysis=True,
             run_metrics_analysis=True,
@@ -138,17 +194,7 @@ class TestPipelineServiceIntegration(unittest.TestCase):
         # Arrange
         invalid_csv = self.io_path / "nonexistent.csv"
 
-        config = PipelineConfig(
-            io_path=self.io_path,
-            repository_path=self.repos_path,
-            project_list_path=invalid_csv,
-            n_repos=1,
-            run_cloner=True,
-            run_cloner_check=False,
-            run_producer_analysis=False,
-            run_consumer_analysis=False,
-            run_metrics_analysis=False,
-        )
+        config = self.make_config(project_list_path=invalid_csv, run_cloner=True)
 
         service = PipelineService(config)
 
@@ -16,10 +16,10 @@ def make_predictions(model, data):
 
 def run_inference():
     """Run inference on test data."""
-    model = load_trained_model('pretrained_model.h5')
+    model = load_trained_model('pretrained_model.keras')
     
     # Generate test data
-    test_data = np.random.random((10, 20))
+    test_data = np.random.default_rng().random((10, 20), dtype=np.float32)
     
     # Make predictions
     results = make_predictions(model, test_data)
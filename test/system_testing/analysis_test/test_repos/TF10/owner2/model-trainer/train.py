@@ -31,8 +31,8 @@ def train():
     # Producer keyword: fit
     model.fit(X_train, y_train, epochs=5, batch_size=32)
     
-    # Save trained model
-    model.save('trained_model.h5')
+    # Save trained model (Keras v3 zip, uncompressed)
+    model.save('trained_model.keras')
     print("Training complete!")
 
 if __name__ == "__main__":
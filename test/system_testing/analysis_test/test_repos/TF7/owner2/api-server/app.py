@@ -1,11 +1,27 @@
-"""Web application."""
+"""Web application.
+
+Serve with a multi-worker WSGI server rather than the Werkzeug dev server:
+
+    gunicorn -w $(nproc) -k gthread --threads 8 app:app
+"""
+import orjson
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson."""
+
+    def dumps(self, obj, **_):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **_):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 @app.route('/api/data', methods=['GET'])
 def get_data():
     return jsonify({'status': 'ok', 'data': []})
-
-if __name__ == "__main__":
-    app.run(port=5000)
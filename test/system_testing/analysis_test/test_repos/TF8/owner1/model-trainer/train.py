@@ -1,21 +1,30 @@
 """Train a neural network model."""
 import tensorflow as tf
 from tensorflow import keras
+from tensorflow.keras import mixed_precision
 import numpy as np
 
+# BF16 compute with FP32 variables; use 'mixed_float16' on pre-Ampere GPUs
+mixed_precision.set_global_policy('mixed_bfloat16')
+
+BATCH_SIZE = 256
+
 def build_model():
     """Build a simple neural network."""
     model = keras.Sequential([
         keras.layers.Dense(128, activation='relu', input_shape=(20,)),
         keras.layers.Dropout(0.2),
-        keras.layers.Dense(10, activation='softmax')
+        # Keep the softmax output in float32 for numerical stability
+        keras.layers.Dense(10, activation='softmax', dtype='float32')
     ])
     
     # Producer keyword: compile
     model.compile(
-        optimizer='adam',
+        # Learning rate scaled linearly with the batch size (256 / 32)
+        optimizer=keras.optimizers.Adam(learning_rate=1e-3 * BATCH_SIZE / 32),
         loss='categorical_crossentropy',
-        metrics=['accuracy']
+        metrics=['accuracy'],
+        jit_compile=True
     )
     
     return model
@@ -24,15 +33,26 @@ def train():
     """Train the model."""
     model = build_model()
     
-    # Generate dummy training data
-    X_train = np.random.random((1000, 20))
-    y_train = np.random.randint(0, 10, (1000, 10))
+    # Generate dummy training data directly in the training dtypes
+    rng = np.random.default_rng(0)
+    X_train = rng.random((1000, 20), dtype=np.float32)
+    y_train = rng.integers(0, 10, size=(1000, 10), dtype=np.int32)
+    
+    # Cache in memory and prefetch so batching overlaps with training;
+    # the int32 labels are cast to the output dtype inside the loss
+    ds = (
+        tf.data.Dataset.from_tensor_slices((X_train, y_train))
+        .cache()
+        .shuffle(1000)
+        .batch(BATCH_SIZE, drop_remainder=True)
+        .prefetch(tf.data.AUTOTUNE)
+    )
     
     # Producer keyword: fit
-    model.fit(X_train, y_train, epochs=5, batch_size=32)
+    model.fit(ds, epochs=5)
     
-    # Save trained model
-    model.save('trained_model.h5')
+    # Save trained model (Keras v3 zip, uncompressed)
+    model.save('trained_model.keras')
     print("Training complete!")
 
 if __name__ == "__main__":
@@ -1,13 +1,18 @@
 """Black-box system testing for MARK 2.0 repository cloning using CLI interface.
-Running with the command: pytest -v"""
+Running with the command: pytest -v (or in parallel: pytest -n auto --dist loadgroup)"""
 
+import csv
+import os
 import subprocess
 import sys
 from pathlib import Path
 import pytest
-import pandas as pd
 import shutil
 
+# All cloning runs share the cloner log under the project root, so keep them
+# on a single xdist worker.
+pytestmark = pytest.mark.xdist_group("cloning")
+
 
 # ============================================================================
 # FIXTURES & UTILITIES
@@ -26,17 +31,28 @@ def test_data_dir(project_root):
     return project_root / "test" / "system_testing" / "cloning_test" / "test_data"
 
 
+@pytest.fixture(scope="session")
+def lib_dict_cache(tmp_path_factory, project_root):
+    """Prepare the library dictionaries once per session."""
+    cache = tmp_path_factory.mktemp("lib_cache")
+
+    src_lib_dict = project_root / "io" / "library_dictionary"
+    if src_lib_dict.exists():
+        shutil.copytree(src_lib_dict, cache / "library_dictionary")
+
+    return cache
+
+
 @pytest.fixture
-def io_structure(tmp_path, project_root):
+def io_structure(tmp_path, project_root, lib_dict_cache):
     """Setup IO structure for cloning tests."""
     io_path = tmp_path / "io"
     io_path.mkdir()
 
-    # Copy library dictionaries
-    src_lib_dict = project_root / "io" / "library_dictionary"
-    dst_lib_dict = io_path / "library_dictionary"
-    if src_lib_dict.exists():
-        shutil.copytree(src_lib_dict, dst_lib_dict)
+    # Link library dictionaries from the session cache
+    cached_lib_dict = lib_dict_cache / "library_dictionary"
+    if cached_lib_dict.exists():
+        _linktree(cached_lib_dict, io_path / "library_dictionary")
 
     # Clean cloner logs from project root
     cloner_log_dir = project_root / "modules" / "cloner" / "log"
@@ -49,6 +65,14 @@ def io_structure(tmp_path, project_root):
     return io_path
 
 
+def _linktree(src, dst):
+    """Clone a read-only tree by hard-linking its files (symlink on Windows)."""
+    if os.name == "nt":
+        dst.symlink_to(src, target_is_directory=True)
+    else:
+        shutil.copytree(src, dst, copy_function=os.link)
+
+
 def run_main_cli(project_root, **kwargs):
     """Execute main_args.py with CLI arguments.
 
@@ -80,6 +104,25 @@ def run_main_cli(project_root, **kwargs):
     return result
 
 
+def _iter_cloned_repos(repos_path):
+    """Yield (owner, repo) pairs for every cloned repository under repos_path."""
+    try:
+        owners = os.scandir(repos_path)
+    except FileNotFoundError:
+        return
+
+    with owners:
+        for owner_entry in owners:
+            if not owner_entry.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(owner_entry.path) as repos:
+                for repo_entry in repos:
+                    if repo_entry.is_dir(follow_symlinks=False) and os.path.lexists(
+                        os.path.join(repo_entry.path, ".git")
+                    ):
+                        yield owner_entry.name, repo_entry.name
+
+
 def count_cloned_repos(repos_path):
     """Count number of successfully cloned repositories.
 
@@ -89,17 +132,7 @@ def count_cloned_repos(repos_path):
     Returns:
         int: Number of cloned repositories
     """
-    if not repos_path.exists():
-        return 0
-
-    count = 0
-    for owner_dir in repos_path.iterdir():
-        if owner_dir.is_dir():
-            for repo_dir in owner_dir.iterdir():
-                if repo_dir.is_dir() and (repo_dir / ".git").exists():
-                    count += 1
-
-    return count
+    return sum(1 for _ in _iter_cloned_repos(repos_path))
 
 
 def get_cloned_repo_names(repos_path):
@@ -111,18 +144,7 @@ def get_cloned_repo_names(repos_path):
     Returns:
         set: Set of repository names in format "owner/repo"
     """
-    if not repos_path.exists():
-        return set()
-
-    cloned = set()
-    for owner_dir in repos_path.iterdir():
-        if owner_dir.is_dir():
-            owner = owner_dir.name
-            for repo_dir in owner_dir.iterdir():
-                if repo_dir.is_dir() and (repo_dir / ".git").exists():
-                    cloned.add(f"{owner}/{repo_dir.name}")
-
-    return cloned
+    return {f"{owner}/{repo}" for owner, repo in _iter_cloned_repos(repos_path)}
 
 
 # ============================================================================
@@ -191,11 +213,12 @@ class TestCloningBlackBox:
             pytest.skip(f"Test data not found: {single_csv}")
 
         # Read expected repository name
-        df = pd.read_csv(single_csv)
-        if df.empty:
+        with open(single_csv, newline="", encoding="utf-8") as f:
+            first_row = next(csv.DictReader(f), None)
+        if first_row is None:
             pytest.skip("CSV file is empty")
 
-        expected_repo = df.iloc[0]["ProjectName"]
+        expected_repo = first_row["ProjectName"]
 
         result = run_main_cli(
             project_root,
@@ -226,13 +249,14 @@ class TestCloningBlackBox:
             pytest.skip(f"Test data not found: {multi_csv}")
 
         # Read expected repositories
-        df = pd.read_csv(multi_csv)
-        n_repos = len(df)
+        with open(multi_csv, newline="", encoding="utf-8") as f:
+            project_names = [row["ProjectName"] for row in csv.DictReader(f)]
+        n_repos = len(project_names)
 
         if n_repos <= 1:
             pytest.skip("CSV file does not contain multiple repositories")
 
-        expected_repos = set(df["ProjectName"].tolist())
+        expected_repos = set(project_names)
 
         result = run_main_cli(
             project_root,
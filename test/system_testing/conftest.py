@@ -0,0 +1,51 @@
+"""Shared Tk fixtures for the GUI and dashboard system tests."""
+
+import pytest
+
+
+def cancel_pending_callbacks(root):
+    """Cancel every after() callback still scheduled on the Tk root."""
+    for after_id in root.tk.splitlist(root.tk.call("after", "info")):
+        root.after_cancel(after_id)
+
+
+@pytest.fixture(scope="session")
+def tk_session_root():
+    """Create one hidden Tk root shared by the whole test session.
+
+    Starting a Tcl interpreter per test is slow and fragile on Windows;
+    the root is destroyed once at the end of the session.
+    """
+    tk = pytest.importorskip("tkinter")
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        # Headless worker (no DISPLAY / Xvfb): skip fast instead of erroring
+        pytest.skip(f"Tk display not available: {e}")
+    root.withdraw()  # Hide the window during tests
+
+    yield root
+
+    # Deterministic shutdown: drain the event loop and drop pending callbacks
+    # before destroying the interpreter, instead of waiting for them to settle
+    try:
+        root.update_idletasks()
+        cancel_pending_callbacks(root)
+        root.destroy()
+    except tk.TclError:
+        pass
+
+
+@pytest.fixture
+def tk_root(tk_session_root):
+    """Provide the shared Tk root, with pending callbacks cancelled after each test.
+
+    Nothing scheduled with after() by one test fires during the next.
+    Widgets are left in place; fixtures that build them clean them up.
+    """
+    root = tk_session_root
+
+    yield root
+
+    cancel_pending_callbacks(root)
+    root.update_idletasks()
@@ -1,14 +1,10 @@
 # Command to run tests: pytest -vv -s test/system_test_dashboard/dashboard_test.py
 """Black-box system testing for MARK 2.0 Dashboard interface.
 
-HOW TO DISABLE DEBUG PRINTS:
-To disable all debug print statements, modify the debug() function (around line 80):
-- Comment out the print(msg) line
-- Uncomment the pass statement
-Example:
-    def debug(msg):
-        #print(msg)
-        pass  # <-- use this instead of print to disable all debug output
+HOW TO ENABLE DEBUG PRINTS:
+Debug output is off by default. To print all debug messages, set the
+module-level DEBUG constant (next to the debug() helper) to True:
+    DEBUG = True
 
 Test Frame (TF) for validating MARK 2.0 Plus Dashboard.
 Run with command: pytest -v test/system_test_dashboard/dashboard_test.py
@@ -24,14 +20,16 @@ Test Frames:
 - TF4: DPC1 + DM1 → Full analysis with all data
 """
 
-import tkinter as tk
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 import pytest
 import shutil
 import csv
-import gc
-import time
+
+# Skip the whole module, instead of failing in every fixture, when the GUI
+# toolkit is not installed
+pytest.importorskip("tkinter")
+pytest.importorskip("ttkbootstrap")
 
 
 # ============================================================================
@@ -45,71 +43,52 @@ def project_root():
     return Path(__file__).resolve().parents[2]
 
 
-@pytest.fixture
-def temp_output_structure(tmp_path):
-    """Setup temporary output structure with empty directories.
+@pytest.fixture(scope="session")
+def output_session_path(tmp_path_factory):
+    """Create the standard output directory structure once per session.
     
     Creates the standard output directory structure:
     - output/producer/
     - output/consumer/
     - output/metrics/
     """
-    output_path = tmp_path / "output"
-    output_path.mkdir()
+    output_path = tmp_path_factory.mktemp("output")
     
     # Create empty output directories
-    (output_path / "producer").mkdir(parents=True)
-    (output_path / "consumer").mkdir(parents=True)
-    (output_path / "metrics").mkdir(parents=True)
+    for category in ("producer", "consumer", "metrics"):
+        (output_path / category).mkdir()
     
     return output_path
 
 
 @pytest.fixture
-def tk_root():
-    """Create a Tk root window for testing.
+def temp_output_structure(output_session_path):
+    """Provide the shared output structure, emptied after each test.
     
-    Include robust cleanup to avoid Tcl/Tk resource issues on Windows.
+    Tests add analysis directories (e.g. producer/producer_1) through the
+    create_*_results helpers; these are removed on teardown so every test
+    starts from empty producer/, consumer/ and metrics/ directories.
     """
-    # Force garbage collection before creating new Tk instance
-    gc.collect()
-    
-    # Small delay to ensure previous Tk resources are fully released
-    time.sleep(0.05)
-    
-    try:
-        root = tk.Tk()
-        root.withdraw()  # Hide the window during tests
-    except Exception as e:
-        # Retry once after cleanup if initial creation fails
-        gc.collect()
-        time.sleep(0.1)
-        root = tk.Tk()
-        root.withdraw()
-    
-    yield root
+    yield output_session_path
     
-    # Robust cleanup
-    try:
-        root.quit()
-        root.update_idletasks()
-        root.destroy()
-    except Exception:
-        pass
-    
-    # Force garbage collection after destroying Tk
-    gc.collect()
+    for category_dir in output_session_path.iterdir():
+        for analysis_dir in category_dir.iterdir():
+            shutil.rmtree(analysis_dir)
+
+
+# ===== DEBUG OUTPUT (set DEBUG = True to print all debug messages) =====
+# Call sites are guarded by "if DEBUG:", so with DEBUG off the debug
+# messages are never formatted.
+DEBUG = False
 
 
-# ===== DEBUG HELPER (comment this function to disable all print statements) =====
 def debug(msg):
     print(msg)
-    #pass  # <-- use this instead of print to disable all output
 
 
 @pytest.fixture
 def dashboard_components(tk_root, temp_output_structure):
-    """Setup Dashboard GUI components for testing."""
+    """Setup Dashboard GUI components for testing, destroyed after each test."""
     from gui.main_window import MainWindow
     from gui.controller import AppController
     from gui.services.output_reader import OutputReader
@@ -123,7 +102,7 @@ def dashboard_components(tk_root, temp_output_structure):
     # Create controller
     controller = AppController(main_window=main_window, output_reader=output_reader)
     
-    return {
+    yield {
         'root': tk_root,
         'main_window': main_window,
         'controller': controller,
@@ -131,29 +110,56 @@ def dashboard_components(tk_root, temp_output_structure):
         'output_reader': output_reader,
         'output_path': temp_output_structure
     }
+    
+    # Destroy only this fixture's window: the session root is shared with
+    # the GUI tests, whose window must survive
+    main_window.notebook.destroy()
 
 
-def create_producer_results(output_path: Path, analysis_id: str, data: list):
-    """Create a producer results.csv file with the given data.
+# Header row and file name of the results CSV of each output category
+RESULTS_CSV_LAYOUT = {
+    "producer": (['ProjectName', 'Is ML producer', 'libraries', 'where', 'keyword', 'line_number'], "results.csv"),
+    "consumer": (['ProjectName', 'Is ML consumer', 'libraries', 'where', 'keyword', 'line_number'], "results.csv"),
+    "metrics": (['ProjectName', 'CC_avg', 'MI_avg'], "metrics.csv"),
+}
+
+
+def write_results_csv(output_path: Path, category: str, analysis_id: str, data: list):
+    """Create the results CSV of one category for the given analysis.
     
     Args:
         output_path: Base output directory path
+        category: Output category ("producer", "consumer" or "metrics")
         analysis_id: Analysis identifier (e.g., "1", "2")
-        data: List of tuples (project_name, is_ml, library, where, keyword, line_number)
+        data: List of row tuples matching the category header
+    
+    Returns:
+        Path of the written file, e.g. output/producer/producer_1/results.csv
     """
-    producer_dir = output_path / "producer" / f"producer_{analysis_id}"
-    producer_dir.mkdir(parents=True, exist_ok=True)
+    header, file_name = RESULTS_CSV_LAYOUT[category]
+    analysis_dir = output_path / category / f"{category}_{analysis_id}"
+    analysis_dir.mkdir(parents=True, exist_ok=True)
     
-    csv_path = producer_dir / "results.csv"
+    csv_path = analysis_dir / file_name
     with open(csv_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
-        writer.writerow(['ProjectName', 'Is ML producer', 'libraries', 'where', 'keyword', 'line_number'])
-        for row in data:
-            writer.writerow(row)
+        writer.writerow(header)
+        writer.writerows(data)
     
     return csv_path
 
 
+def create_producer_results(output_path: Path, analysis_id: str, data: list):
+    """Create a producer results.csv file with the given data.
+    
+    Args:
+        output_path: Base output directory path
+        analysis_id: Analysis identifier (e.g., "1", "2")
+        data: List of tuples (project_name, is_ml, library, where, keyword, line_number)
+    """
+    return write_results_csv(output_path, "producer", analysis_id, data)
+
+
 def create_consumer_results(output_path: Path, analysis_id: str, data: list):
     """Create a consumer results.csv file with the given data.
     
@@ -162,17 +168,7 @@ def create_consumer_results(output_path: Path, analysis_id: str, data: list):
         analysis_id: Analysis identifier (e.g., "1", "2")
         data: List of tuples (project_name, is_ml, library, where, keyword, line_number)
     """
-    consumer_dir = output_path / "consumer" / f"consumer_{analysis_id}"
-    consumer_dir.mkdir(parents=True, exist_ok=True)
-    
-    csv_path = consumer_dir / "results.csv"
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['ProjectName', 'Is ML consumer', 'libraries', 'where', 'keyword', 'line_number'])
-        for row in data:
-            writer.writerow(row)
-    
-    return csv_path
+    return write_results_csv(output_path, "consumer", analysis_id, data)
 
 
 def create_metrics_results(output_path: Path, analysis_id: str, data: list):
@@ -183,17 +179,16 @@ def create_metrics_results(output_path: Path, analysis_id: str, data: list):
         analysis_id: Analysis identifier (e.g., "1", "2")
         data: List of tuples (project_name, cc_avg, mi_avg)
     """
-    metrics_dir = output_path / "metrics" / f"metrics_{analysis_id}"
-    metrics_dir.mkdir(parents=True, exist_ok=True)
-    
-    csv_path = metrics_dir / "metrics.csv"
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['ProjectName', 'CC_avg', 'MI_avg'])
-        for row in data:
-            writer.writerow(row)
+    return write_results_csv(output_path, "metrics", analysis_id, data)
+
+
+def parse_label_value(text: str, convert):
+    """Parse the value of a "Name: value" label text with convert().
     
-    return csv_path
+    E.g. "Producer: 5" -> 5; a text without ": " gives convert(0).
+    """
+    _, separator, value = text.rpartition(": ")
+    return convert(value) if separator else convert(0)
 
 
 def get_summary_label_values(dashboard_view) -> dict:
@@ -203,13 +198,11 @@ def get_summary_label_values(dashboard_view) -> dict:
         Dictionary with keys 'Producer', 'Consumer', 'Producer & Consumer' 
         and their integer values.
     """
-    result = {}
-    for key, label in dashboard_view.summary_labels.items():
-        text = label.cget("text")
-        # Parse "Producer: 5" -> 5
-        value = int(text.split(": ")[1]) if ": " in text else 0
-        result[key] = value
-    return result
+    # Parse "Producer: 5" -> 5
+    return {
+        key: parse_label_value(label.cget("text"), int)
+        for key, label in dashboard_view.summary_labels.items()
+    }
 
 
 def get_metrics_label_values(dashboard_view) -> dict:
@@ -218,13 +211,11 @@ def get_metrics_label_values(dashboard_view) -> dict:
     Returns:
         Dictionary with metric names and their float values.
     """
-    result = {}
-    for key, label in dashboard_view.metrics_labels.items():
-        text = label.cget("text")
-        # Parse "Media Complexity Cyclomatic: 3.5" -> 3.5
-        value = float(text.split(": ")[1]) if ": " in text else 0.0
-        result[key] = value
-    return result
+    # Parse "Media Complexity Cyclomatic: 3.5" -> 3.5
+    return {
+        key: parse_label_value(label.cget("text"), float)
+        for key, label in dashboard_view.metrics_labels.items()
+    }
 
 
 def get_keywords_table_data(dashboard_view) -> list:
@@ -315,10 +306,11 @@ class TestDashboardSystemTestFrames:
             "Precondition DM0 failed: metrics directory is not empty"
         )
         
-        debug(f"\n[DEBUG] TC1 - Preconditions:")
-        debug(f"  DPC0 (producer empty): {len(list(producer_path.iterdir())) == 0}")
-        debug(f"  DPC0 (consumer empty): {len(list(consumer_path.iterdir())) == 0}")
-        debug(f"  DM0 (metrics empty): {len(list(metrics_path.iterdir())) == 0}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC1 - Preconditions:")
+            debug(f"  DPC0 (producer empty): {len(list(producer_path.iterdir())) == 0}")
+            debug(f"  DPC0 (consumer empty): {len(list(consumer_path.iterdir())) == 0}")
+            debug(f"  DM0 (metrics empty): {len(list(metrics_path.iterdir())) == 0}")
         
         # Action: Refresh to load analyses
         controller._refresh_output_tree()
@@ -326,9 +318,10 @@ class TestDashboardSystemTestFrames:
         # Oracle 1: No analyses available
         analyses = get_analysis_list(dashboard_view)
         
-        debug(f"\n[DEBUG] TC1 - Analysis list:")
-        debug(f"  Expected: []")
-        debug(f"  Actual: {analyses}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC1 - Analysis list:")
+            debug(f"  Expected: []")
+            debug(f"  Actual: {analyses}")
         
         assert len(analyses) == 0, (
             f"TC1 FAILED: Expected no analyses, but found {len(analyses)}\n"
@@ -351,9 +344,10 @@ class TestDashboardSystemTestFrames:
             except Exception:
                 continue
         
-        debug(f"\n[DEBUG] TC1 - Default message text:")
-        debug(f"  Expected: '{expected_message}'")
-        debug(f"  Actual: '{actual_text}'")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC1 - Default message text:")
+            debug(f"  Expected: '{expected_message}'")
+            debug(f"  Actual: '{actual_text}'")
         
         assert message_found, (
             f"TC1 FAILED: Expected message '{expected_message}' not found\n"
@@ -427,10 +421,11 @@ class TestDashboardSystemTestFrames:
             "Precondition DM1 failed: metrics directory is empty"
         )
         
-        debug(f"\n[DEBUG] TC2 - Preconditions:")
-        debug(f"  DPC0 (producer empty): {len(list(producer_path.iterdir())) == 0}")
-        debug(f"  DPC0 (consumer empty): {len(list(consumer_path.iterdir())) == 0}")
-        debug(f"  DM1 (metrics has data): {len(list(metrics_path.iterdir())) > 0}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC2 - Preconditions:")
+            debug(f"  DPC0 (producer empty): {len(list(producer_path.iterdir())) == 0}")
+            debug(f"  DPC0 (consumer empty): {len(list(consumer_path.iterdir())) == 0}")
+            debug(f"  DM1 (metrics has data): {len(list(metrics_path.iterdir())) > 0}")
         
         # Action: Refresh to load analyses
         controller._refresh_output_tree()
@@ -438,9 +433,10 @@ class TestDashboardSystemTestFrames:
         # Oracle 1: Analysis "1" is available
         analyses = get_analysis_list(dashboard_view)
         
-        debug(f"\n[DEBUG] TC2 - Analysis list:")
-        debug(f"  Expected: ['1']")
-        debug(f"  Actual: {analyses}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC2 - Analysis list:")
+            debug(f"  Expected: ['1']")
+            debug(f"  Actual: {analyses}")
         
         assert "1" in analyses, (
             f"TC2 FAILED: Expected analysis '1' in list\n"
@@ -456,9 +452,10 @@ class TestDashboardSystemTestFrames:
         summary_values = get_summary_label_values(dashboard_view)
         expected_summary = {"Producer": 0, "Consumer": 0, "Producer & Consumer": 0}
         
-        debug(f"\n[DEBUG] TC2 - Summary values:")
-        debug(f"  Expected: {expected_summary}")
-        debug(f"  Actual: {summary_values}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC2 - Summary values:")
+            debug(f"  Expected: {expected_summary}")
+            debug(f"  Actual: {summary_values}")
         
         assert summary_values == expected_summary, (
             f"TC2 FAILED: Summary values mismatch\n"
@@ -473,11 +470,12 @@ class TestDashboardSystemTestFrames:
         expected_cc = round((4.74 + 2.8 + 2.3 + 2.3) / 4, 2)  # 3.04
         expected_mi = round((38.84 + 51.22 + 50.41 + 64.56) / 4, 2)  # 51.26
         
-        debug(f"\n[DEBUG] TC2 - Metrics values:")
-        debug(f"  Expected CC: {expected_cc}")
-        debug(f"  Actual CC: {metrics_values.get('Media Complexity Cyclomatic', 0)}")
-        debug(f"  Expected MI: {expected_mi}")
-        debug(f"  Actual MI: {metrics_values.get('Media Maintainability Index', 0)}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC2 - Metrics values:")
+            debug(f"  Expected CC: {expected_cc}")
+            debug(f"  Actual CC: {metrics_values.get('Media Complexity Cyclomatic', 0)}")
+            debug(f"  Expected MI: {expected_mi}")
+            debug(f"  Actual MI: {metrics_values.get('Media Maintainability Index', 0)}")
         
         assert metrics_values["Media Complexity Cyclomatic"] == expected_cc, (
             f"TC2 FAILED: Cyclomatic Complexity mismatch\n"
@@ -491,20 +489,22 @@ class TestDashboardSystemTestFrames:
         # Oracle 4: Keywords table is empty
         keywords_data = get_keywords_table_data(dashboard_view)
         
-        debug(f"\n[DEBUG] TC2 - Keywords table:")
-        debug(f"  Expected: [] (empty)")
-        debug(f"  Actual: {keywords_data}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC2 - Keywords table:")
+            debug(f"  Expected: [] (empty)")
+            debug(f"  Actual: {keywords_data}")
         
         assert len(keywords_data) == 0, (
             f"TC2 FAILED: Keywords table should be empty\n"
             f"Found: {keywords_data}"
         )
         
-        debug(f"\nTC2 PASSED:")
-        debug(f"  - Analysis '1' available")
-        debug(f"  - Summary: Producer=0, Consumer=0, Producer & Consumer=0")
-        debug(f"  - Metrics: CC={expected_cc}, MI={expected_mi}")
-        debug(f"  - Keywords: empty")
+        if DEBUG:
+            debug(f"\nTC2 PASSED:")
+            debug(f"  - Analysis '1' available")
+            debug(f"  - Summary: Producer=0, Consumer=0, Producer & Consumer=0")
+            debug(f"  - Metrics: CC={expected_cc}, MI={expected_mi}")
+            debug(f"  - Keywords: empty")
 
     # ========================================================================
     # TC3/TF3: DPC1 + DM0 - Only producer/consumer available
@@ -583,10 +583,11 @@ class TestDashboardSystemTestFrames:
             "Precondition DM0 failed: metrics directory is not empty"
         )
         
-        debug(f"\n[DEBUG] TC3 - Preconditions:")
-        debug(f"  DPC1 (producer has data): {len(list(producer_path.iterdir())) > 0}")
-        debug(f"  DPC1 (consumer has data): {len(list(consumer_path.iterdir())) > 0}")
-        debug(f"  DM0 (metrics empty): {len(list(metrics_path.iterdir())) == 0}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC3 - Preconditions:")
+            debug(f"  DPC1 (producer has data): {len(list(producer_path.iterdir())) > 0}")
+            debug(f"  DPC1 (consumer has data): {len(list(consumer_path.iterdir())) > 0}")
+            debug(f"  DM0 (metrics empty): {len(list(metrics_path.iterdir())) == 0}")
         
         # Action: Refresh to load analyses
         controller._refresh_output_tree()
@@ -610,9 +611,10 @@ class TestDashboardSystemTestFrames:
         summary_values = get_summary_label_values(dashboard_view)
         expected_summary = {"Producer": 3, "Consumer": 1, "Producer & Consumer": 1}
         
-        debug(f"\n[DEBUG] TC3 - Summary values:")
-        debug(f"  Expected: {expected_summary}")
-        debug(f"  Actual: {summary_values}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC3 - Summary values:")
+            debug(f"  Expected: {expected_summary}")
+            debug(f"  Actual: {summary_values}")
         
         assert summary_values == expected_summary, (
             f"TC3 FAILED: Summary values mismatch\n"
@@ -623,11 +625,12 @@ class TestDashboardSystemTestFrames:
         # Oracle 3: Metrics shows zeros
         metrics_values = get_metrics_label_values(dashboard_view)
         
-        debug(f"\n[DEBUG] TC3 - Metrics values:")
-        debug(f"  Expected CC: 0")
-        debug(f"  Actual CC: {metrics_values.get('Media Complexity Cyclomatic', 0)}")
-        debug(f"  Expected MI: 0")
-        debug(f"  Actual MI: {metrics_values.get('Media Maintainability Index', 0)}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC3 - Metrics values:")
+            debug(f"  Expected CC: 0")
+            debug(f"  Actual CC: {metrics_values.get('Media Complexity Cyclomatic', 0)}")
+            debug(f"  Expected MI: 0")
+            debug(f"  Actual MI: {metrics_values.get('Media Maintainability Index', 0)}")
         
         assert metrics_values["Media Complexity Cyclomatic"] == 0, (
             f"TC3 FAILED: Cyclomatic Complexity should be 0\n"
@@ -646,8 +649,9 @@ class TestDashboardSystemTestFrames:
         # keras, .predict( -> 1 occurrence
         keywords_data = get_keywords_table_data(dashboard_view)
         
-        debug(f"\n[DEBUG] TC3 - Keywords table:")
-        debug(f"  Data found: {keywords_data}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC3 - Keywords table:")
+            debug(f"  Data found: {keywords_data}")
         
         # Expected exact keywords table
         expected_keywords = [
@@ -682,11 +686,12 @@ class TestDashboardSystemTestFrames:
                 f"Expected: {expected_count}, Actual: {actual_count}"
             )
         
-        debug(f"\nTC3 PASSED:")
-        debug(f"  - Analysis '1' available")
-        debug(f"  - Summary: Producer=3, Consumer=1, Producer & Consumer=1")
-        debug(f"  - Metrics: CC=0, MI=0")
-        debug(f"  - Keywords table matches expected values")
+        if DEBUG:
+            debug(f"\nTC3 PASSED:")
+            debug(f"  - Analysis '1' available")
+            debug(f"  - Summary: Producer=3, Consumer=1, Producer & Consumer=1")
+            debug(f"  - Metrics: CC=0, MI=0")
+            debug(f"  - Keywords table matches expected values")
 
     # ========================================================================
     # TC4/TF4: DPC1 + DM1 - All data available
@@ -769,10 +774,11 @@ class TestDashboardSystemTestFrames:
         assert len(list(consumer_path.iterdir())) > 0, "DPC1 failed: consumer empty"
         assert len(list(metrics_path.iterdir())) > 0, "DM1 failed: metrics empty"
         
-        debug(f"\n[DEBUG] TC4 - Preconditions:")
-        debug(f"  DPC1 (producer has data): True")
-        debug(f"  DPC1 (consumer has data): True")
-        debug(f"  DM1 (metrics has data): True")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC4 - Preconditions:")
+            debug(f"  DPC1 (producer has data): True")
+            debug(f"  DPC1 (consumer has data): True")
+            debug(f"  DM1 (metrics has data): True")
         
         # Action: Refresh to load analyses
         controller._refresh_output_tree()
@@ -793,9 +799,10 @@ class TestDashboardSystemTestFrames:
         summary_values = get_summary_label_values(dashboard_view)
         expected_summary = {"Producer": 3, "Consumer": 2, "Producer & Consumer": 2}
         
-        debug(f"\n[DEBUG] TC4 - Summary values:")
-        debug(f"  Expected: {expected_summary}")
-        debug(f"  Actual: {summary_values}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC4 - Summary values:")
+            debug(f"  Expected: {expected_summary}")
+            debug(f"  Actual: {summary_values}")
         
         assert summary_values == expected_summary, (
             f"TC4 FAILED: Summary mismatch\n"
@@ -810,11 +817,12 @@ class TestDashboardSystemTestFrames:
         expected_mi = round((51.22 + 50.41 + 41.65) / 3, 2)
         metrics_values = get_metrics_label_values(dashboard_view)
         
-        debug(f"\n[DEBUG] TC4 - Metrics values:")
-        debug(f"  Expected CC: {expected_cc}")
-        debug(f"  Actual CC: {metrics_values['Media Complexity Cyclomatic']}")
-        debug(f"  Expected MI: {expected_mi}")
-        debug(f"  Actual MI: {metrics_values['Media Maintainability Index']}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC4 - Metrics values:")
+            debug(f"  Expected CC: {expected_cc}")
+            debug(f"  Actual CC: {metrics_values['Media Complexity Cyclomatic']}")
+            debug(f"  Expected MI: {expected_mi}")
+            debug(f"  Actual MI: {metrics_values['Media Maintainability Index']}")
         
         assert metrics_values["Media Complexity Cyclomatic"] == expected_cc, (
             f"TC4 FAILED: CC mismatch. Expected {expected_cc}, got {metrics_values['Media Complexity Cyclomatic']}"
@@ -826,8 +834,9 @@ class TestDashboardSystemTestFrames:
         # Oracle 4: Keywords table shows data with exact values
         keywords_data = get_keywords_table_data(dashboard_view)
         
-        debug(f"\n[DEBUG] TC4 - Keywords table:")
-        debug(f"  Data: {keywords_data}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TC4 - Keywords table:")
+            debug(f"  Data: {keywords_data}")
         
         # Expected exact keywords table
         expected_keywords = [
@@ -863,7 +872,8 @@ class TestDashboardSystemTestFrames:
                 f"Expected: {expected_count}, Actual: {actual_count}"
             )
         
-        debug(f"\nTC4 PASSED:")
-        debug(f"  - Summary: Producer=3, Consumer=2, Producer & Consumer=2")
-        debug(f"  - Metrics: CC={expected_cc}, MI={expected_mi}")
-        debug(f"  - Keywords table matches expected values")
+        if DEBUG:
+            debug(f"\nTC4 PASSED:")
+            debug(f"  - Summary: Producer=3, Consumer=2, Producer & Consumer=2")
+            debug(f"  - Metrics: CC={expected_cc}, MI={expected_mi}")
+            debug(f"  - Keywords table matches expected values")
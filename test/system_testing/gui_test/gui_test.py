@@ -1,14 +1,10 @@
 # Command to run tests: pytest -vv -s test/system_test_gui/gui_test.py
 """Black-box system testing for MARK 2.0 GUI interface.
 
-HOW TO DISABLE DEBUG PRINTS:
-To disable all debug print statements, modify the debug() function (around line 202):
-- Comment out the print(msg) line
-- Uncomment the pass statement
-Example:
-    def debug(msg):
-        #print(msg)
-        pass  # <-- use this instead of print to disable all debug output
+HOW TO ENABLE DEBUG PRINTS:
+Debug output is off by default. To print all debug messages, set the
+module-level DEBUG constant (next to the debug() helper) to True:
+    DEBUG = True
 
 Test Frame (TF) for validating MARK 2.0 Plus GUI.
 Run with command: pytest -v test/system_test_gui/gui_test.py
@@ -24,14 +20,26 @@ Categories and constraints tested:
 - N1/N2/N3/N4: N-repos value
 """
 
-import tkinter as tk
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 import pytest
 import shutil
-import csv
-import gc
-import time
+from functools import lru_cache
+
+# Skip the whole module, instead of failing in every fixture, when the GUI
+# toolkit is not installed
+pytest.importorskip("tkinter")
+pytest.importorskip("ttkbootstrap")
+
+from gui.services.pipeline_service import PipelineResult
+
+# Dialog shown by the controller when the pipeline succeeds
+SUCCESS_TITLE = "Success"
+SUCCESS_MSG = "Pipeline completed successfully!"
+
+# Result stored by the mocked pipeline runs (read-only for the controller)
+SUCCESS_RESULT = PipelineResult(success=True, error_message=None)
 
 
 # ============================================================================
@@ -45,23 +53,28 @@ def project_root():
     return Path(__file__).resolve().parents[2]
 
 
-@pytest.fixture
-def temp_io_structure(tmp_path, project_root):
-    """Setup temporary IO structure with library dictionaries."""
-    io_path = tmp_path / "io"
-    io_path.mkdir()
-    
+@pytest.fixture(scope="session")
+def temp_io_structure(tmp_path_factory, project_root):
+    """Build the IO layout (output dirs, repos, library dictionaries) once per session.
+
+    The tree is shared by all tests and must be treated as read-only: the
+    frames only point the configuration at it (the pipeline is mocked or
+    stops before writing). Anything a test creates goes under its tmp_path.
+    """
+    io_path = tmp_path_factory.mktemp("io")
+
     # Create output directories
-    (io_path / "output" / "producer").mkdir(parents=True)
-    (io_path / "output" / "consumer").mkdir(parents=True)
-    (io_path / "output" / "metrics").mkdir(parents=True)
-    
+    for category in ("producer", "consumer", "metrics"):
+        (io_path / "output" / category).mkdir(parents=True)
+
+    # Repository directory (RP1), so tests don't have to create it
+    (io_path / "repos").mkdir()
+
     # Copy library dictionaries
     src_lib_dict = project_root / "io" / "library_dictionary"
-    dst_lib_dict = io_path / "library_dictionary"
     if src_lib_dict.exists():
-        shutil.copytree(src_lib_dict, dst_lib_dict)
-    
+        shutil.copytree(src_lib_dict, io_path / "library_dictionary")
+
     return io_path
 
 
@@ -80,59 +93,98 @@ def temp_csv_file(tmp_path):
     return csv_path
 
 
+@pytest.fixture(scope="session")
+def projects_csv_bytes():
+    """Factory returning the encoded project CSV for a number of data rows.
+
+    Each row count is rendered once per session; tests write the cached
+    bytes with Path.write_bytes().
+    """
+    @lru_cache(maxsize=None)
+    def _render(num_rows: int) -> bytes:
+        # Fields never need quoting, so rows are joined directly (CRLF like csv.writer)
+        rows = [b'owner,project_name,url\r\n']
+        rows.extend(
+            f'owner{i},project{i},https://github.com/owner{i}/project{i}\r\n'.encode('utf-8')
+            for i in range(num_rows)
+        )
+        return b''.join(rows)
+    return _render
+
+
+@pytest.fixture(scope="session")
+def projects_csv_path(tmp_path_factory, projects_csv_bytes):
+    """Factory returning a shared project CSV path for a number of data rows.
+
+    Each row count is written once per session; tests only read the file
+    (the controller counts its rows), so the same path is handed out again.
+    """
+    csv_dir = tmp_path_factory.mktemp("csvs")
+
+    @lru_cache(maxsize=None)
+    def _make(num_rows: int) -> Path:
+        csv_path = csv_dir / f"projects_{num_rows}.csv"
+        csv_path.write_bytes(projects_csv_bytes(num_rows))
+        return csv_path
+    return _make
+
+
+@pytest.fixture(scope="session")
+def empty_csv_path(projects_csv_path):
+    """Header-only project CSV (CSV1 + CS0) shared, read-only, by the session."""
+    return projects_csv_path(0)
+
+
 @pytest.fixture
-def create_csv_with_rows(temp_csv_file):
+def create_csv_with_rows(temp_csv_file, projects_csv_bytes):
     """Factory fixture to create CSV with specified number of rows."""
     def _create_csv(num_rows: int):
-        with open(temp_csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])
-            for i in range(num_rows):
-                writer.writerow([f'owner{i}', f'project{i}', f'https://github.com/owner{i}/project{i}'])
+        temp_csv_file.write_bytes(projects_csv_bytes(num_rows))
         return temp_csv_file
     return _create_csv
 
 
-@pytest.fixture
-def tk_root():
-    """Create a Tk root window for testing.
-    
-    Include robust cleanup to avoid Tcl/Tk resource issues on Windows.
+# ConfigView variable attribute by get_config_values() key
+CONFIG_VARS = {
+    'io_path': 'io_path_var',
+    'repository_path': 'repo_path_var',
+    'project_list_path': 'project_list_var',
+    'n_repos': 'n_repos_var',
+    'run_cloner': 'run_cloner_var',
+    'run_cloner_check': 'run_cloner_check_var',
+    'run_producer_analysis': 'run_producer_var',
+    'run_consumer_analysis': 'run_consumer_var',
+    'run_metrics_analysis': 'run_metrics_var',
+    'rules_3': 'rules_3_var',
+}
+
+
+def apply_config(config_view, **values):
+    """Set several configuration values of config_view at once.
+
+    Keys are the ones returned by get_config_values(); paths may be given
+    as Path or str. Unknown keys raise KeyError.
     """
-    
-    # Force garbage collection before creating new Tk instance
-    gc.collect()
-    
-    # Small delay to ensure previous Tk resources are fully released
-    time.sleep(0.05)
-    
-    try:
-        root = tk.Tk()
-        root.withdraw()  # Hide the window during tests
-    except Exception as e:
-        # Retry once after cleanup if initial creation fails
-        gc.collect()
-        time.sleep(0.1)
-        root = tk.Tk()
-        root.withdraw()
-    
-    yield root
-    
-    # Robust cleanup
-    try:
-        root.quit()
-        root.update_idletasks()
-        root.destroy()
-    except Exception:
-        pass
-    
-    # Force garbage collection after destroying Tk
-    gc.collect()
+    unknown = values.keys() - CONFIG_VARS.keys()
+    if unknown:
+        raise KeyError(f"Unknown configuration keys: {sorted(unknown)}")
+    for key, value in values.items():
+        var = getattr(config_view, CONFIG_VARS[key])
+        var.set(str(value) if isinstance(value, Path) else value)
 
 
-@pytest.fixture
-def gui_components(tk_root, project_root):
-    """Setup GUI components for testing."""
+def config_var_values(config_view):
+    """Return the raw variable values of config_view by get_config_values() key."""
+    return {key: getattr(config_view, attr).get() for key, attr in CONFIG_VARS.items()}
+
+
+@pytest.fixture(scope="session")
+def gui_session(tk_session_root, project_root):
+    """Build the GUI stack (main window, controller, views) once per session.
+
+    Tests use the gui_components fixture, which resets this shared stack
+    instead of creating a new window for every test.
+    """
     # Import GUI modules
     from gui.main_window import MainWindow
     from gui.controller import AppController
@@ -142,20 +194,173 @@ def gui_components(tk_root, project_root):
     output_reader = OutputReader(project_root / "io" / "output")
     
     # Create main window
-    main_window = MainWindow(tk_root)
+    main_window = MainWindow(tk_session_root)
     
     # Create controller
     controller = AppController(main_window=main_window, output_reader=output_reader)
+    config_view = main_window.get_config_view()
     
     return {
-        'root': tk_root,
+        'root': tk_session_root,
         'main_window': main_window,
         'controller': controller,
-        'config_view': main_window.get_config_view(),
-        'output_reader': output_reader
+        'config_view': config_view,
+        'output_reader': output_reader,
+        # Initial state, restored by reset_gui() around every test
+        'default_output_path': output_reader.output_path,
+        'default_config': config_var_values(config_view),
     }
 
 
+def reset_gui(components):
+    """Return the shared GUI stack to its initial, idle state.
+
+    The controller forgets the last pipeline run, the output reader points
+    back to the default output path and the configuration view gets its
+    default values back.
+    """
+    controller = components['controller']
+    controller._pipeline_service = None
+    controller._pipeline_thread = None
+    controller._result = None
+    components['output_reader'].output_path = components['default_output_path']
+
+    config_view = components['config_view']
+    apply_config(config_view, **components['default_config'])
+    config_view.set_running_state(False)
+
+
+@pytest.fixture
+def gui_components(gui_session, tk_root):
+    """Provide the shared GUI components, reset to defaults around each test.
+
+    Pending after() callbacks are cancelled by tk_root after the test so
+    nothing scheduled by one test fires during the next.
+    """
+    reset_gui(gui_session)
+
+    yield gui_session
+
+    thread = gui_session['controller']._pipeline_thread
+    if thread is not None:
+        thread.join(timeout=5)
+    reset_gui(gui_session)
+
+
+class FakeVar:
+    """Plain-Python stand-in for tk.StringVar/IntVar/BooleanVar (get/set only)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def headless_config_view(monkeypatch):
+    """ConfigView without a Tk root: FakeVar variables and no widgets.
+
+    For the tests that only exercise the configuration values
+    (get_config_values/apply_config), not the rendered view.
+    """
+    import gui.views.config_view as config_view_module
+
+    monkeypatch.setattr(
+        config_view_module,
+        "tk",
+        SimpleNamespace(StringVar=FakeVar, IntVar=FakeVar, BooleanVar=FakeVar),
+    )
+    monkeypatch.setattr(config_view_module.ConfigView, "create_widgets", lambda self: None)
+    return config_view_module.ConfigView(parent=None)
+
+
+class SyncThread:
+    """Stand-in for threading.Thread that runs its target inside start()."""
+
+    def __init__(self, target, daemon=None):
+        self._target = target
+
+    def start(self):
+        self._target()
+
+    def is_alive(self):
+        return False
+
+    def join(self, timeout=None):
+        pass
+
+
+@pytest.fixture
+def sync_pipeline(monkeypatch):
+    """Run the controller pipeline synchronously on the test thread.
+
+    Only the controller's view of the threading module is replaced, so
+    _on_start_pipeline runs the pipeline and completes it before returning;
+    threads started by the pipeline itself are unaffected. Returns the list
+    of pipeline threads the controller created, so tests can check that
+    rejected configurations never start one.
+    """
+    import gui.controller
+    created = []
+
+    def make_thread(target, daemon=None):
+        thread = SyncThread(target, daemon)
+        created.append(thread)
+        return thread
+
+    monkeypatch.setattr(gui.controller, "threading", SimpleNamespace(Thread=make_thread))
+    return created
+
+
+@pytest.fixture
+def mock_pipeline_success(gui_components):
+    """Replace the pipeline run with a fake that just stores SUCCESS_RESULT."""
+    controller = gui_components['controller']
+    with patch.object(
+        controller, '_run_pipeline_thread',
+        side_effect=lambda: setattr(controller, '_result', SUCCESS_RESULT),
+    ):
+        yield
+
+
+class DialogRecorder(list):
+    """Stand-in for MainWindow.show_info/show_error that records (title, msg) calls."""
+
+    def __call__(self, title, msg):
+        self.append((title, msg))
+
+
+@pytest.fixture
+def dialogs(monkeypatch, gui_components):
+    """Record the info and error dialogs shown during the test.
+
+    Returns a namespace with the info and error DialogRecorder lists; the
+    original MainWindow methods are restored by monkeypatch at teardown.
+    """
+    main_window = gui_components['main_window']
+    recorded = SimpleNamespace(info=DialogRecorder(), error=DialogRecorder())
+    monkeypatch.setattr(main_window, "show_info", recorded.info)
+    monkeypatch.setattr(main_window, "show_error", recorded.error)
+    return recorded
+
+
+def assert_pipeline_success(info_shown, frame, title=SUCCESS_TITLE, message=SUCCESS_MSG):
+    """Assert that the first info dialog is the pipeline success message."""
+    assert info_shown, f"{frame} FAILED: success message NOT shown (no info dialog)"
+    shown_title, shown_msg = info_shown[0]
+    assert shown_title == title and message in shown_msg, (
+        f"{frame} FAILED: success message NOT shown\n"
+        f"  Expected: '{title}' / '{message}'\n"
+        f"  Received: {info_shown}"
+    )
+
+
 def set_all_steps(config_view, value: bool):
     """Set all pipeline steps to the specified value."""
     config_view.run_cloner_var.set(value)
@@ -203,14 +408,110 @@ def cloning_verify_selected(config_view) -> bool:
             config_view.run_cloner_check_var.get())
 
 
+def assert_step_preconditions(config_view, steps: str, cloning: str = None):
+    """Assert the ST0/ST1/ST2 and CV1/CV2 preconditions from one state read.
+
+    Returns the step state so callers can reuse it instead of querying Tk again.
+    """
+    state = get_step_selection_state(config_view)
+    selected = [name for name, value in state.items() if value]
+    expected_selected = {
+        'ST0': not selected,
+        'ST1': 0 < len(selected) < len(state),
+        'ST2': len(selected) == len(state),
+    }
+    assert expected_selected[steps], (
+        f"Precondition {steps} failed: selected steps {selected}"
+    )
+    if cloning is not None:
+        both = state['run_cloner'] and state['run_cloner_check']
+        assert both == (cloning == 'CV1'), (
+            f"Precondition {cloning} failed: selected steps {selected}"
+        )
+    return state
+
+
 # ============================================================================
 # TEST CLASS - TEST FRAMES
 # ============================================================================
 
- # ===== DEBUG HELPER (comment this function to disable all print statements) =====
+# TF1-TF6 cases. Keys:
+# - steps: "none" (ST0) or "cloning" (ST1 + CV1: Cloning + Verify only)
+# - io / repo: "exists", "missing" (or None for repo: not configured)
+# - csv: None (not configured), "missing" (CSV0) or "empty" (CSV1 + CS0)
+# - rules_3: None (not set) or the Rule 3 value (RU3_1 / RU3_0)
+# - mock_pipeline: replace the pipeline thread with a successful fake run
+# - oracle: (dialog kind, title, message, "equals" | "contains"); the message
+#   is formatted with {io} and {csv_name}, "|" separates required fragments
+SUCCESS = ("info", SUCCESS_TITLE, SUCCESS_MSG, "contains")
+
+# Pipeline step keys of ConfigView.get_config_values()
+STEP_KEYS = (
+    'run_cloner',
+    'run_cloner_check',
+    'run_producer_analysis',
+    'run_consumer_analysis',
+    'run_metrics_analysis',
+)
+
+FRAME_CASES_TF1_TF6 = [
+    pytest.param(
+        dict(steps="none", io="exists", repo="exists", csv=None, rules_3=None,
+             mock_pipeline=False, oracle=SUCCESS),
+        id="TF1",
+    ),
+    pytest.param(
+        dict(steps="cloning", io="missing", repo=None, csv=None, rules_3=None,
+             mock_pipeline=False,
+             oracle=("error", "Invalid Path", "IO path does not exist: {io}", "equals")),
+        id="TF2",
+    ),
+    pytest.param(
+        dict(steps="cloning", io="exists", repo="missing", csv="empty", rules_3=None,
+             mock_pipeline=True, oracle=SUCCESS),
+        id="TF3",
+    ),
+    pytest.param(
+        dict(steps="cloning", io="exists", repo="exists", csv="missing", rules_3=None,
+             mock_pipeline=False,
+             oracle=("error", "Pipeline Failed",
+                     "Error: [Errno 2] No such file or directory:|{csv_name}", "contains")),
+        id="TF4",
+    ),
+    pytest.param(
+        dict(steps="cloning", io="exists", repo="exists", csv="empty", rules_3=False,
+             mock_pipeline=True, oracle=SUCCESS),
+        id="TF5",
+    ),
+    pytest.param(
+        dict(steps="cloning", io="exists", repo="exists", csv="empty", rules_3=True,
+             mock_pipeline=True, oracle=SUCCESS),
+        id="TF6",
+    ),
+]
+
+
+# TF7-TF10 cases: CSV data rows, N-repos value and the expected
+# "Invalid Value" error message (None: the pipeline completes successfully)
+FRAME_CASES_TF7_TF10 = [
+    pytest.param(dict(rows=2, n_repos=-1, error="N-repos cannot be negative: -1"),
+                 id="TF7"),
+    pytest.param(dict(rows=1, n_repos=0, error=None), id="TF8"),
+    pytest.param(dict(rows=5, n_repos=3, error=None), id="TF9"),
+    pytest.param(dict(rows=3, n_repos=100, error="N-repos (100) exceeds CSV rows (3)"),
+                 id="TF10"),
+]
+
+
+# ===== DEBUG OUTPUT (set DEBUG = True to print all debug messages) =====
+# Call sites are guarded by "if DEBUG:", so with DEBUG off the debug
+# messages are never formatted.
+DEBUG = False
+
+
 def debug(msg):
-    #print(msg)
-    pass  # <-- use this instead of print to disable all output
+    print(msg)
+
 
 class TestGUISystemTestFrames:
     """
@@ -223,1025 +524,278 @@ class TestGUISystemTestFrames:
     """
 
     # ========================================================================
-    # TF1: ST0 - No step selected
+    # TF1-TF6: step selection, IO/repo directories and CSV state
+    #
+    # TF1: ST0                                     - No step selected
+    # TF2: ST1 + CV1 + IO0                         - IO directory missing
+    # TF3: ST1 + CV1 + IO1 + RP0                   - Repo directory missing
+    # TF4: ST1 + CV1 + IO1 + RP1 + CSV0            - CSV file missing
+    # TF5: ST1 + CV1 + IO1 + RP1 + CSV1 + CS0 + RU3_0 - Empty CSV, Rule3 OFF
+    # TF6: ST1 + CV1 + IO1 + RP1 + CSV1 + CS0 + RU3_1 - Empty CSV, Rule3 ON
     # ========================================================================
-    def test_TF1_no_step_selected(self, gui_components, temp_io_structure):
+    @pytest.mark.parametrize("case", FRAME_CASES_TF1_TF6)
+    def test_TF1_to_TF6_paths_and_csv(
+        self, request, sync_pipeline, dialogs, gui_components, temp_io_structure,
+        tmp_path, empty_csv_path, case
+    ):
         """
-        TF1: ST0 - No Step selected
+        TF1-TF6: one frame per FRAME_CASES_TF1_TF6 entry.
+
+        INPUT (per case):
+        - Selected steps: none (ST0) or Cloning + Verify only (ST1 + CV1)
+        - IO directory: temp_io_structure (IO1) or a nonexistent path (IO0)
+        - Repo directory: temp_io_structure/repos (RP1) or a nonexistent path (RP0)
+        - CSV file: missing (CSV0) or header only (CSV1 + CS0), N-repos = 0
+        - Rule 3: on (RU3_1) / off (RU3_0) when relevant
 
-        ID: TF1
-        Combination: ST0
-        Oracle: [Success] Pipeline completed (no operations executed)
-        
-        INPUT:
-        - Selected steps: NONE (run_cloner=False, run_cloner_check=False,
-                            run_producer=False, run_consumer=False, run_metrics=False)
-        - IO directory: temp_io_structure (valid temporary directory)
-        - Repo directory: temp_io_structure/repos (created in test)
-        
         EXPECTED OUTPUT:
-        - Message: "Success" / "Pipeline completed successfully!"
-        - All Steps disabled
+        - The info/error title and message of the case oracle
+        - RP0: repo directory created; RU3_x: rules_3 kept in the configuration
         """
-
+        frame = request.node.callspec.id
         config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
         controller = gui_components['controller']
 
-        # Setup: no step selected
-        set_all_steps(config_view, False)
-
-        # Setup: valid paths
-        config_view.io_path_var.set(str(temp_io_structure))
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
-
-        # Precondition ST0
-        assert not any_step_selected(config_view), (
-            "Precondition failed: at least one step is selected"
-        )
+        # Setup: step selection
+        if case['steps'] == "cloning":
+            set_cloning_steps_only(config_view, cloner=True, verify=True)
+            assert_step_preconditions(config_view, 'ST1', 'CV1')
+        else:
+            set_all_steps(config_view, False)
+            assert_step_preconditions(config_view, 'ST0')
+
+        # Configuration values, applied in one call once collected
+        values = {}
+
+        # Setup: IO directory
+        if case['io'] == "exists":
+            io_path = temp_io_structure
+            assert io_path.exists(), "Precondition IO1 failed"
+        else:
+            io_path = tmp_path / "nonexistent_io_directory"
+            assert not io_path.exists(), "Precondition IO0 failed"
+        values['io_path'] = io_path
+
+        # Setup: repo directory
+        repo_path = None
+        if case['repo'] == "exists":
+            repo_path = temp_io_structure / "repos"
+            assert repo_path.is_dir(), "Precondition RP1 failed"
+        elif case['repo'] == "missing":
+            repo_path = tmp_path / "test_repos"
+            assert not repo_path.exists(), "Precondition RP0 failed"
+        if repo_path is not None:
+            values['repository_path'] = repo_path
+
+        # Setup: CSV file
+        csv_path = None
+        if case['csv'] == "missing":
+            csv_path = tmp_path / "nonexistent_projects.csv"
+            assert not csv_path.exists(), "Precondition CSV0 failed"
+        elif case['csv'] == "empty":
+            csv_path = empty_csv_path  # header only, shared by the session
+            values['n_repos'] = 0  # Empty CSV
+        if csv_path is not None:
+            values['project_list_path'] = csv_path
+
+        # Setup: Rule 3
+        if case['rules_3'] is not None:
+            values['rules_3'] = case['rules_3']
+
+        apply_config(config_view, **values)
 
         # Oracle 1: step configuration
         config = config_view.get_config_values()
-        steps_enabled = any([
-            config['run_cloner'],
-            config['run_cloner_check'],
-            config['run_producer_analysis'],
-            config['run_consumer_analysis'],
-            config['run_metrics_analysis']
-        ])
-
-        debug("\n[DEBUG] TF1 - Step configuration state:")
-        debug(f"  All steps disabled (expected): True")
-        debug(f"  All steps disabled (actual): {not steps_enabled}")
-
-        assert not steps_enabled, (
-            "TF1 FAILED: at least one step is enabled\n"
+        cloning = case['steps'] == "cloning"
+        expected_steps = dict.fromkeys(STEP_KEYS, False)
+        expected_steps.update(run_cloner=cloning, run_cloner_check=cloning)
+        actual_steps = {key: config[key] for key in STEP_KEYS}
+        assert actual_steps == expected_steps, (
+            f"{frame} FAILED: unexpected step configuration\n"
             f"Steps state: {config}"
         )
 
-        # Mock show_info
-        info_shown = []
-        original_show_info = main_window.show_info
-        main_window.show_info = lambda title, msg: info_shown.append((title, msg))
-
-        try:
-            # Action
-            controller._on_start_pipeline()
+        if DEBUG:
+            debug(f"\n[DEBUG] {frame} - Preconditions:")
+            debug(f"  IO path: {io_path} (exists: {io_path.exists()})")
+            debug(f"  Repo path: {repo_path}")
+            debug(f"  CSV path: {csv_path}")
 
-            if controller._pipeline_thread:
-                controller._pipeline_thread.join(timeout=5)
-                controller._on_pipeline_complete()
+        # Dialogs recorded by the dialogs fixture
+        info_shown, error_shown = dialogs.info, dialogs.error
 
-            # Oracle 2: verify success message
-            expected_title = "Success"
-            expected_msg = "Pipeline completed successfully!"
+        # Action
+        if case['mock_pipeline']:
+            # Simulate a successful run without executing the real pipeline
+            def mock_pipeline():
+                if repo_path is not None:
+                    repo_path.mkdir(parents=True, exist_ok=True)
+                controller._result = SUCCESS_RESULT
 
-            success_shown = any(
-                title == expected_title and expected_msg in msg
-                for title, msg in info_shown
-            )
-
-            debug("\n[DEBUG] TF1 - Pipeline start result:")
-            debug(f"  Expected title: '{expected_title}'")
-            debug(f"  Expected message: '{expected_msg}'")
-            debug(f"  Messages received: {info_shown}")
-
-            assert success_shown, (
-                "TF1 FAILED: success message NOT shown\n"
-                f"Received: {info_shown}"
-            )
-
-            debug("\nTF1 PASSED:")
-            debug("  - All steps disabled")
-            debug("  - Success message shown")
+            with patch.object(controller, '_run_pipeline_thread', side_effect=mock_pipeline):
+                controller._on_start_pipeline()
+        else:
+            # sync_pipeline: the pipeline runs and completes inside this call
+            controller._on_start_pipeline()
 
-        finally:
-            main_window.show_info = original_show_info
+        # Oracle 2: dialog title and message
+        kind, expected_title, expected_msg, match = case['oracle']
+        expected_msg = expected_msg.format(io=io_path, csv_name=csv_path and csv_path.name)
 
+        if DEBUG:
+            debug(f"\n[DEBUG] {frame} - Dialogs:")
+            debug(f"  Expected: {kind} '{expected_title}' / '{expected_msg}' ({match})")
+            debug(f"  Info messages: {info_shown}")
+            debug(f"  Error messages: {error_shown}")
 
-    # ========================================================================
-    # TF2: ST1 + CV1 + IO0 - IO directory missing
-    # ========================================================================
-    def test_TF2_io_directory_missing(self, gui_components, tmp_path):
-        """
-        TF2: ST1 + CV1 + IO0 - IO directory missing
-        
-        ID: TF2
-        Combination: ST1 + CV1 + IO0
-        Oracle: [Error] IO directory missing
-        
-        INPUT:
-        - Selected steps: Cloning + Verify (run_cloner=True, run_cloner_check=True)
-        - IO directory: tmp_path/nonexistent_io_directory (DOES NOT EXIST)
-        - Repo directory: not configured (irrelevant, IO fails first)
-        
-        EXPECTED OUTPUT:
-        - Error: "Invalid Path" / "IO path does not exist: {path}"
-        """
-        config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
-        controller = gui_components['controller']
-        
-        # Setup: Select Cloning + Verify (CV1) - partial steps (ST1)
-        set_cloning_steps_only(config_view, cloner=True, verify=True)
-        
-        # Verify precondition ST1: at least one step selected (not all)
-        assert any_step_selected(config_view), (
-            "Precondition ST1 failed: no step selected"
-        )
-        assert not all_steps_selected(config_view), (
-            "Precondition ST1 failed: all steps are selected"
-        )
-        
-        # Verify precondition CV1: Cloning and Verify selected
-        assert cloning_verify_selected(config_view), (
-            "Precondition CV1 failed: Cloning and Verify not both selected"
-        )
-        
-        # Setup IO0: Nonexistent IO directory
-        nonexistent_io = tmp_path / "nonexistent_io_directory"
-        config_view.io_path_var.set(str(nonexistent_io))
-        
-        # Verify precondition IO0: directory does not exist
-        assert not nonexistent_io.exists(), (
-            "Precondition IO0 failed: IO directory exists"
-        )
-        
-        # Mock show_error to capture the error
-        error_shown = []
-        original_show_error = main_window.show_error
-        main_window.show_error = lambda title, msg: error_shown.append((title, msg))
-        
-        try:
-            # Action: Attempt to start the pipeline
-            controller._on_start_pipeline()
-            
-            # Oracle: An error must be shown for IO path
-            assert len(error_shown) > 0, (
-                "TF2 FAILED: No error shown for missing IO directory"
-            )
-            
+        if kind == "info":
+            assert_pipeline_success(info_shown, frame, expected_title, expected_msg)
+        else:
+            assert len(error_shown) > 0, f"{frame} FAILED: No error shown"
             error_title, error_msg = error_shown[0]
-            
-            # Expected values
-            expected_title = "Invalid Path"
-            expected_msg = f"IO path does not exist: {nonexistent_io}"
-            
-            # DEBUG: Print expected vs actual results
-            debug(f"\n[DEBUG] TF2 - Error message validation:")
-            debug(f"  Expected title: '{expected_title}'")
-            debug(f"  Actual title: '{error_title}'")
-            debug(f"  Expected message: '{expected_msg}'")
-            debug(f"  Actual message: '{error_msg}'")
-            
-            # Verify that the title is exactly "Invalid Path"
             assert error_title == expected_title, (
-                f"TF2 FAILED: Unexpected error title.\n"
+                f"{frame} FAILED: Unexpected error title.\n"
                 f"  Expected: '{expected_title}'\n"
                 f"  Actual: '{error_title}'"
             )
-            
-            # Verify that the message is exactly "IO path does not exist: {path}"
-            assert error_msg == expected_msg, (
-                f"TF2 FAILED: Error message does not match.\n"
-                f"  Expected: '{expected_msg}'\n"
-                f"  Actual: '{error_msg}'"
-            )
-            
-            debug(f"TF2 PASSED: IO directory error correctly shown")
-            debug(f"  - Title: {error_title}")
-            debug(f"  - Message: {error_msg}")
-            
-        finally:
-            main_window.show_error = original_show_error
-
-    # ========================================================================
-    # TF3: ST1 + CV1 + IO1 + RP0 - Repo directory missing
-    # ========================================================================
-    def test_TF3_repo_directory_missing(self, gui_components, temp_io_structure, tmp_path):
-        """
-        TF3: ST1 + CV1 + IO1 + RP0 - Repo directory missing
-        
-        Combination: ST1 + CV1 + IO1 + RP0
-        Oracle: [Single] repo directory does not exist, gets created, pipeline success
-        
-        INPUT:
-        - Selected steps: Cloning + Verify (run_cloner=True, run_cloner_check=True)
-        - IO directory: temp_io_structure (temporary directory EXISTS)
-        - Repo directory: tmp_path/test_repos (DOES NOT EXIST, will be created)
-        - CSV file: temp_io_structure/test_projects.csv (empty, header only)
-        - N-repos: 0
-        
-        EXPECTED OUTPUT:
-        - Repo directory created automatically
-        - Message: "Success" / "Pipeline completed successfully!"
-        """
-        config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
-        controller = gui_components['controller']
-        
-        # Setup: Select Cloning + Verify (CV1) - partial steps (ST1)
-        set_cloning_steps_only(config_view, cloner=True, verify=True)
-        
-        # Verify precondition ST1: at least one step selected (not all)
-        assert any_step_selected(config_view), (
-            "Precondition ST1 failed: no step selected"
+            if match == "equals":
+                assert error_msg == expected_msg, (
+                    f"{frame} FAILED: Error message does not match.\n"
+                    f"  Expected: '{expected_msg}'\n"
+                    f"  Actual: '{error_msg}'"
+                )
+            else:
+                assert all(part in error_msg for part in expected_msg.split("|")), (
+                    f"{frame} FAILED: Error message does not match.\n"
+                    f"  Expected to contain: '{expected_msg}'\n"
+                    f"  Actual: '{error_msg}'"
+                )
+
+        # Oracle 3: only a missing IO directory (TF2) is rejected before the
+        # pipeline starts; no pipeline thread may be created in that case
+        expected_threads = 0 if case['io'] == "missing" else 1
+        assert len(sync_pipeline) == expected_threads, (
+            f"{frame} FAILED: {len(sync_pipeline)} pipeline thread(s) created, "
+            f"expected {expected_threads}"
         )
-        
-        # Verify precondition CV1: Cloning and Verify selected
-        assert cloning_verify_selected(config_view), (
-            "Precondition CV1 failed: Cloning and Verify not both selected"
-        )
-        
-        # Setup IO1: IO directory exists
-        config_view.io_path_var.set(str(temp_io_structure))
-        assert temp_io_structure.exists(), (
-            "Precondition IO1 failed: IO directory does not exist"
-        )
-        
-        # Setup RP0: Repo directory does not exist
-        nonexistent_repo = tmp_path / "test_repos"
-        config_view.repo_path_var.set(str(nonexistent_repo))
-        
-        # Verify precondition RP0: repo directory does not exist
-        assert not nonexistent_repo.exists(), (
-            "Precondition RP0 failed: repo directory exists"
-        )
-        
-        # Setup: Create an empty test CSV (header only)
-        csv_path = temp_io_structure / "test_projects.csv"
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            import csv as csv_module
-            writer = csv_module.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])
-        
-        config_view.project_list_var.set(str(csv_path))
-        config_view.n_repos_var.set(0)  # Empty CSV
-        
-        debug(f"\n[DEBUG] TF3 - Preconditions:")
-        debug(f"  ST1 (at least one step): {any_step_selected(config_view)}")
-        debug(f"  CV1 (Cloning+Verify): {cloning_verify_selected(config_view)}")
-        debug(f"  IO1 (IO exists): {temp_io_structure.exists()}")
-        debug(f"  RP0 (repo does NOT exist): {not nonexistent_repo.exists()}")
-        
-        # Mock show_info to capture success message
-        info_shown = []
-        original_show_info = main_window.show_info
-        main_window.show_info = lambda title, msg: info_shown.append((title, msg))
-        
-        # Mock the pipeline service to simulate success without real execution
-        from unittest.mock import MagicMock, patch
-        from gui.services.pipeline_service import PipelineResult
-        
-        mock_result = PipelineResult(success=True, error_message=None)
-        
-        try:
-            with patch.object(controller, '_run_pipeline_thread') as mock_run:
-                # Simulate pipeline execution
-                def mock_pipeline():
-                    # Simulate repo directory creation
-                    nonexistent_repo.mkdir(parents=True, exist_ok=True)
-                    controller._result = mock_result
-                
-                mock_run.side_effect = mock_pipeline
-                
-                # Action: Start the pipeline
-                controller._on_start_pipeline()
-                
-                # Wait for (mocked) thread to finish
-                if controller._pipeline_thread:
-                    controller._pipeline_thread.join(timeout=2)
-                
-                # Force completion
-                controller._on_pipeline_complete()
-            
-            # Oracle part 1: Repo directory must have been created
-            debug(f"\n[DEBUG] TF3 - State after execution:")
-            debug(f"  Repo directory created: {nonexistent_repo.exists()}")
-            
-            assert nonexistent_repo.exists(), (
-                f"TF3 FAILED: Repo directory was not created.\n"
-                f"  Path: {nonexistent_repo}"
-            )
-            
-            # Oracle part 2: Success message must be shown
-            expected_title = "Success"
-            expected_msg = "Pipeline completed successfully!"
-            
-            success_shown = any(
-                title == expected_title and expected_msg in msg
-                for title, msg in info_shown
+        if not expected_threads:
+            assert controller._pipeline_thread is None, (
+                f"{frame} FAILED: a pipeline thread is attached to the controller"
             )
-            
-            debug(f"  Info messages captured: {info_shown}")
-            debug(f"  Success message found: {success_shown}")
-            
-            assert success_shown, (
-                f"TF3 FAILED: Success message NOT shown.\n"
-                f"  Expected: '{expected_title}' / '{expected_msg}'\n"
-                f"  Received: {info_shown}"
-            )
-            
-            debug(f"\nTF3 PASSED: Repo directory created and pipeline completed successfully")
-            debug(f"  - IO path (exists): {temp_io_structure}")
-            debug(f"  - Repo path (created): {nonexistent_repo}")
-            
-        finally:
-            main_window.show_info = original_show_info
 
-    # ========================================================================
-    # TF4: ST1 + CV1 + IO1 + RP1 + CSV0 - CSV file missing
-    # ========================================================================
-    def test_TF4_csv_file_missing(self, gui_components, temp_io_structure, tmp_path):
-        """
-        TF4: ST1 + CV1 + IO1 + RP1 + CSV0 - CSV file missing
-        
-        ID: TF4
-        Combination: ST1 + CV1 + IO1 + RP1 + CSV0
-        Oracle: [Error] CSV missing (required because CV1)
-        
-        INPUT:
-        - Selected steps: Cloning + Verify 
-            * run_cloner = True
-            * run_cloner_check = True  
-            * run_producer = False
-            * run_consumer = False
-            * run_metrics = False
-        - IO directory: temp_io_structure (e.g. C:/temp/pytest-xxx/io) - EXISTS
-        - Repo directory: temp_io_structure/repos - EXISTS
-        - CSV file: tmp_path/nonexistent_projects.csv - DOES NOT EXIST
-        
-        EXPECTED OUTPUT:
-        - Error: "Pipeline Failed" 
-        - Message: "Error: [Errno 2] No such file or directory: 'nonexistent_projects.csv'"
-        """
-        config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
-        controller = gui_components['controller']
-        
-        # Setup ST1: Select Cloning + Verify (CV1) - partial steps
-        set_cloning_steps_only(config_view, cloner=True, verify=True)
-        
-        # Verify precondition ST1
-        assert any_step_selected(config_view), "Precondition ST1 failed"
-        assert not all_steps_selected(config_view), "Precondition ST1 failed: all steps selected"
-        
-        # Verify precondition CV1
-        assert cloning_verify_selected(config_view), "Precondition CV1 failed"
-        
-        # Setup IO1: IO directory exists
-        config_view.io_path_var.set(str(temp_io_structure))
-        assert temp_io_structure.exists(), "Precondition IO1 failed"
-        
-        # Setup RP1: Repo directory exists
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
-        assert repo_path.exists(), "Precondition RP1 failed"
-        
-        # Setup CSV0: CSV file does not exist
-        nonexistent_csv = tmp_path / "nonexistent_projects.csv"
-        config_view.project_list_var.set(str(nonexistent_csv))
-        assert not nonexistent_csv.exists(), "Precondition CSV0 failed"
-        
-        debug(f"\n[DEBUG] TF4 - Preconditions:")
-        debug(f"  ST1 (at least one step): {any_step_selected(config_view)}")
-        debug(f"  CV1 (Cloning+Verify): {cloning_verify_selected(config_view)}")
-        debug(f"  IO1 (IO exists): {temp_io_structure.exists()}")
-        debug(f"  RP1 (repo exists): {repo_path.exists()}")
-        debug(f"  CSV0 (CSV does NOT exist): {not nonexistent_csv.exists()}")
-        
-        # Mock show_error to capture the error
-        error_shown = []
-        original_show_error = main_window.show_error
-        main_window.show_error = lambda title, msg: error_shown.append((title, msg))
-        
-        try:
-            # Action: Start the pipeline
-            controller._on_start_pipeline()
-            
-            # Wait for pipeline thread to finish (if started)
-            if controller._pipeline_thread:
-                controller._pipeline_thread.join(timeout=5)
-                controller._on_pipeline_complete()
-            
-            # Oracle: An error must be shown for missing CSV
-            debug(f"\n[DEBUG] TF4 - Errors captured: {error_shown}")
-            
-            assert len(error_shown) > 0, (
-                "TF4 FAILED: No error shown for Missing CSV"
-            )
-            
-            error_title, error_msg = error_shown[0]
-            
-            # Expected values: FileNotFoundError for non-existent CSV
-            expected_title = "Pipeline Failed"
-            # The message must contain FileNotFoundError and the CSV filename
-            csv_filename = nonexistent_csv.name
-            
-            debug(f"  Expected Title: '{expected_title}'")
-            debug(f"  Actual Title: '{error_title}'")
-            debug(f"  Actual Message: '{error_msg}'")
-            
-            assert error_title == expected_title, (
-                f"TF4 FAILED: Unexpected error title.\n"
-                f"  Expected: '{expected_title}'\n"
-                f"  Actual: '{error_title}'"
-            )
-            
-            # Verify that the message contains FileNotFoundError and the CSV filename
-            # Verify that the message indicates that the CSV does NOT exist
-            assert (
-                "Error: [Errno 2] No such file or directory:" in error_msg
-                and csv_filename in error_msg
-            ), (
-                f"TF4 FAILED: Error message does not indicate Missing CSV.\n"
-                f"Actual: '{error_msg}'"
+        # Oracle 4: RP0 - the repo directory has been created
+        if case['repo'] == "missing":
+            assert repo_path.exists(), (
+                f"{frame} FAILED: Repo directory was not created.\n"
+                f"  Path: {repo_path}"
             )
-            
-            debug(f"\nTF4 PASSED: Missing CSV error correctly shown")
-            debug(f"  - Title: {error_title}")
-            debug(f"  - Message: {error_msg}")
-            
-        finally:
-            main_window.show_error = original_show_error
 
-    # ========================================================================
-    # TF5: ST1 + CV1 + IO1 + RP1 + CSV1 + CS0 + RU3_0 - Empty CSV, Rule3 OFF
-    # ========================================================================
-    def test_TF5_csv_empty_rule3_off(self, gui_components, temp_io_structure):
-        """
-        TF5: ST1 + CV1 + IO1 + RP1 + CSV1 + CS0 + RU3_0
-        
-        ID: TF5
-        Combination: ST1 + CV1 + IO1 + RP1 + CSV1 + CS0 + RU3_0
-        Oracle: [Single] Analysis completed successfully
-        
-        INPUT:
-        - Selected steps: Cloning + Verify
-            * run_cloner = True
-            * run_cloner_check = True
-            * run_producer = False
-            * run_consumer = False
-            * run_metrics = False
-        - IO directory: temp_io_structure - EXISTS
-        - Repo directory: temp_io_structure/repos - EXISTS
-        - CSV file: temp_io_structure/empty_projects.csv - EXISTS, EMPTY (header only)
-        - Rule 3: False (RU3_0)
-        
-        EXPECTED OUTPUT:
-        - Message: "Success" / "Pipeline completed successfully!"
-        """
-        config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
-        controller = gui_components['controller']
-        
-        # Setup ST1 + CV1
-        set_cloning_steps_only(config_view, cloner=True, verify=True)
-        assert any_step_selected(config_view), "Precondition ST1 failed"
-        assert cloning_verify_selected(config_view), "Precondition CV1 failed"
-        
-        # Setup IO1
-        config_view.io_path_var.set(str(temp_io_structure))
-        assert temp_io_structure.exists(), "Precondition IO1 failed"
-        
-        # Setup RP1
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
-        
-        # Setup CSV1 + CS0: CSV file exists but is empty (header only)
-        csv_path = temp_io_structure / "empty_projects.csv"
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])  # header only
-        config_view.project_list_var.set(str(csv_path))
-        
-        # Setup N2: N-repos = 0 (Empty CSV)
-        config_view.n_repos_var.set(0)
-        
-        # Setup RU3_0: Rule 3 disabled
-        config_view.rules_3_var.set(False)
-        
-        debug(f"\n[DEBUG] TF5 - Preconditions:")
-        debug(f"  CSV1 (CSV exists): {csv_path.exists()}")
-        debug(f"  CS0 (Empty CSV): True (header only)")
-        debug(f"  RU3_0 (Rule3 OFF): {not config_view.rules_3_var.get()}")
-        
-        # Mock show_info
-        info_shown = []
-        original_show_info = main_window.show_info
-        main_window.show_info = lambda title, msg: info_shown.append((title, msg))
-        
-        from gui.services.pipeline_service import PipelineResult
-        mock_result = PipelineResult(success=True, error_message=None)
-        
-        try:
-            with patch.object(controller, '_run_pipeline_thread') as mock_run:
-                def mock_pipeline():
-                    controller._result = mock_result
-                mock_run.side_effect = mock_pipeline
-                
-                controller._on_start_pipeline()
-                if controller._pipeline_thread:
-                    controller._pipeline_thread.join(timeout=2)
-                controller._on_pipeline_complete()
-            
-            success_shown = any(
-                title == "Success" and "Pipeline completed successfully" in msg
-                for title, msg in info_shown
+        # Oracle 5: RU3_0 / RU3_1 - rules_3 kept in the configuration
+        if case['rules_3'] is not None:
+            rules_3 = config_view.rules_3_var.get()
+            assert rules_3 == case['rules_3'], (
+                f"{frame} FAILED: rules_3 should be {case['rules_3']}.\n"
+                f"  Actual: {rules_3}"
             )
-            
-            debug(f"\n[DEBUG] TF5 - Info messages: {info_shown}")
-            
-            assert success_shown, (
-                f"TF5 FAILED: Success message NOT shown.\n"
-                f"Actual: {info_shown}"
-            )
-            
-            # Verify that rules_3 is False (RU3_0)
-            config = config_view.get_config_values()
-            assert config['rules_3'] == False, (
-                f"TF5 FAILED: rules_3 should be False (RU3_0).\n"
-                f"  Actual: {config['rules_3']}"
-            )
-            
-            debug(f"  Verify RU3_0: rules_3={config['rules_3']}")
-            debug(f"\nTF5 PASSED: Analysis completed with Empty CSV and Rule3 OFF")
-            
-        finally:
-            main_window.show_info = original_show_info
 
-    # ========================================================================
-    # TF6: ST1 + CV1 + IO1 + RP1 + CSV1 + CS0 + RU3_1 - Empty CSV, Rule3 ON
-    # ========================================================================
-    def test_TF6_csv_empty_rule3_on(self, gui_components, temp_io_structure):
-        """
-        TF6: ST1 + CV1 + IO1 + RP1 + CSV1 + CS0 + RU3_1
-        
-        ID: TF6
-        Combination: ST1 + CV1 + IO1 + RP1 + CSV1 + CS0 + RU3_1
-        Oracle: [Single] Analysis completed successfully
-        
-        INPUT:
-        - Selected steps: Cloning + Verify
-            * run_cloner = True
-            * run_cloner_check = True
-            * run_producer = False
-            * run_consumer = False
-            * run_metrics = False
-        - IO directory: temp_io_structure - EXISTS
-        - Repo directory: temp_io_structure/repos - EXISTS
-        - CSV file: temp_io_structure/empty_projects2.csv - EXISTS, EMPTY (header only)
-        - Rule 3: True (RU3_1)
-        
-        EXPECTED OUTPUT:
-        - Message: "Success" / "Pipeline completed successfully!"
-        - Configuration: rules_3 = True (RU3_1)
-        """
-        config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
-        controller = gui_components['controller']
-        
-        # Setup ST1 + CV1
-        set_cloning_steps_only(config_view, cloner=True, verify=True)
-        
-        # Setup IO1
-        config_view.io_path_var.set(str(temp_io_structure))
-        
-        # Setup RP1
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
-        
-        # Setup CSV1 + CS0: Empty CSV
-        csv_path = temp_io_structure / "empty_projects2.csv"
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])
-        config_view.project_list_var.set(str(csv_path))
-        
-        # Setup N2: N-repos = 0 (Empty CSV)
-        config_view.n_repos_var.set(0)
-        
-        # Setup RU3_1: Rule 3 enabled
-        config_view.rules_3_var.set(True)
-        
-        debug(f"\n[DEBUG] TF6 - Preconditions:")
-        debug(f"  RU3_1 (Rule3 ON): {config_view.rules_3_var.get()}")
-        
-        info_shown = []
-        original_show_info = main_window.show_info
-        main_window.show_info = lambda title, msg: info_shown.append((title, msg))
-        
-        from gui.services.pipeline_service import PipelineResult
-        mock_result = PipelineResult(success=True, error_message=None)
-        
-        try:
-            with patch.object(controller, '_run_pipeline_thread') as mock_run:
-                def mock_pipeline():
-                    controller._result = mock_result
-                mock_run.side_effect = mock_pipeline
-                
-                controller._on_start_pipeline()
-                if controller._pipeline_thread:
-                    controller._pipeline_thread.join(timeout=2)
-                controller._on_pipeline_complete()
-            
-            success_shown = any(
-                title == "Success" and "Pipeline completed successfully" in msg
-                for title, msg in info_shown
-            )
-            
-            debug(f"\n[DEBUG] TF6 - Info messages: {info_shown}")
-            
-            assert success_shown, f"TF6 FAILED: Success message NOT shown."
-            
-            # Verify that rules_3 is True (RU3_1)
-            config = config_view.get_config_values()
-            assert config['rules_3'] == True, (
-                f"TF6 FAILED: rules_3 should be True (RU3_1).\n"
-                f"  Actual: {config['rules_3']}"
-            )
-            
-            debug(f"  Verify RU3_1: rules_3={config['rules_3']}")
-            debug(f"\nTF6 PASSED: Analysis completed with Empty CSV and Rule3 ON")
-            
-        finally:
-            main_window.show_info = original_show_info
+        if DEBUG:
+            debug(f"\n{frame} PASSED")
 
     # ========================================================================
-    # TF7: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N1 - N-repos negative
+    # TF7-TF10: N-repos value against the CSV rows
+    #
+    # TF7:  ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N1 - N-repos negative
+    # TF8:  ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N2 - N-repos = 0
+    # TF9:  ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N3 - 0 < N-repos < #rows
+    # TF10: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N4 - N-repos > #rows
     # ========================================================================
-    def test_TF7_n_repos_negative(self, gui_components, temp_io_structure):
+    @pytest.mark.parametrize("case", FRAME_CASES_TF7_TF10)
+    def test_TF7_to_TF10_n_repos(
+        self, request, sync_pipeline, mock_pipeline_success, dialogs, gui_components,
+        temp_io_structure, projects_csv_path, case
+    ):
         """
-        TF7: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N1
-        
-        ID: TF7
-        Combination: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N1
-        Oracle: [Error] N-repos < 0
-        
-        INPUT:
-        - Selected steps: Cloning + Verify
-            * run_cloner = True
-            * run_cloner_check = True
-        - IO directory: temp_io_structure - EXISTS
-        - Repo directory: temp_io_structure/repos - EXISTS
-        - CSV file: temp_io_structure/projects_TF7.csv - EXISTS, 2 data rows
-        - N-repos: -1 (negative value)
-        
-        EXPECTED OUTPUT:
-        - Error: "Invalid Value" / "N-repos cannot be negative: -1"
-        """
-        config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
-        controller = gui_components['controller']
-        
-        # Setup ST1 + CV1
-        set_cloning_steps_only(config_view, cloner=True, verify=True)
-        
-        # Setup IO1
-        config_view.io_path_var.set(str(temp_io_structure))
-        
-        # Setup RP1
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
-        
-        # Setup CSV1 + CS1: CSV with data
-        csv_path = temp_io_structure / "projects_TF7.csv"
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])
-            writer.writerow(['owner1', 'project1', 'https://github.com/owner1/project1'])
-            writer.writerow(['owner2', 'project2', 'https://github.com/owner2/project2'])
-        config_view.project_list_var.set(str(csv_path))
-        
-        # Setup N1: N-repos < 0
-        config_view.n_repos_var.set(-1)
-        
-        debug(f"\n[DEBUG] TF7 - Preconditions:")
-        debug(f"  CS1 (CSV not empty): True")
-        debug(f"  N1 (N-repos < 0): {config_view.n_repos_var.get()}")
-        
-        # Mock show_error to capture the error
-        error_shown = []
-        original_show_error = main_window.show_error
-        main_window.show_error = lambda title, msg: error_shown.append((title, msg))
-        
-        try:
-            # Action: Attempt to start the pipeline
-            controller._on_start_pipeline()
-            
-            # Oracle: An error must be shown for negative n_repos
-            assert len(error_shown) > 0, (
-                "TF7 FAILED: No error shown for negative n_repos"
-            )
-            
-            error_title, error_msg = error_shown[0]
-            expected_title = "Invalid Value"
-            expected_msg = "N-repos cannot be negative: -1"
-            
-            debug(f"\n[DEBUG] TF7 - Result:")
-            debug(f"  Error title: {error_title}")
-            debug(f"  Error message: {error_msg}")
-            
-            assert error_title == expected_title, (
-                f"TF7 FAILED: Unexpected error title.\n"
-                f"  Expected: '{expected_title}'\n"
-                f"  Actual: '{error_title}'"
-            )
-            assert error_msg == expected_msg, (
-                f"TF7 FAILED: Unexpected error message.\n"
-                f"  Expected: '{expected_msg}'\n"
-                f"  Actual: '{error_msg}'"
-            )
-            
-            debug(f"\nTF7 PASSED: Error correctly shown for negative n_repos")
-            
-        finally:
-            main_window.show_error = original_show_error
+        TF7-TF10: one frame per FRAME_CASES_TF7_TF10 entry.
 
-    # ========================================================================
-    # TF8: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N2 - N-repos = 0
-    # ========================================================================
-    def test_TF8_n_repos_zero(self, gui_components, temp_io_structure):
-        """
-        TF8: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N2
-        
-        ID: TF8
-        Combination: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N2
-        Oracle: [Success] N-repos = 0 accepted, pipeline completed
-        
         INPUT:
         - Selected steps: Cloning + Verify
             * run_cloner = True
             * run_cloner_check = True
         - IO directory: temp_io_structure - EXISTS
         - Repo directory: temp_io_structure/repos - EXISTS
-        - CSV file: temp_io_structure/projects_TF8.csv - EXISTS, 1 data row
-        - N-repos: 0
-        
+        - CSV file: shared projects CSV (projects_csv_path) - EXISTS, case rows
+        - N-repos: case value (N1 < 0, N2 = 0, N3 < #rows, N4 > #rows)
+
         EXPECTED OUTPUT:
-        - Configuration accepts n_repos = 0
-        - Message: "Success" / "Pipeline completed successfully!"
+        - N1 / N4: "Invalid Value" error, no pipeline thread created
+        - N2 / N3: "Success" / "Pipeline completed successfully!"
         """
+        frame = request.node.callspec.id
         config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
         controller = gui_components['controller']
-        
+
         # Setup ST1 + CV1
         set_cloning_steps_only(config_view, cloner=True, verify=True)
-        
-        # Setup IO1
-        config_view.io_path_var.set(str(temp_io_structure))
-        
-        # Setup RP1
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
-        
-        # Setup CSV1 + CS1
-        csv_path = temp_io_structure / "projects_TF8.csv"
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])
-            writer.writerow(['owner1', 'project1', 'https://github.com/owner1/project1'])
-        config_view.project_list_var.set(str(csv_path))
-        
-        # Setup N2: N-repos = 0
-        config_view.n_repos_var.set(0)
-        
-        debug(f"\n[DEBUG] TF8 - Preconditions:")
-        debug(f"  N2 (N-repos = 0): {config_view.n_repos_var.get()}")
-        
-        # Verify that n_repos is 0 in the configuration
-        config = config_view.get_config_values()
-        assert config['n_repos'] == 0, (
-            f"TF8 FAILED: n_repos should be 0.\n"
-            f"Value: {config['n_repos']}"
+
+        # Setup IO1 + RP1 + CSV1 + CS1 + N-repos
+        repo_path = temp_io_structure / "repos"  # created by temp_io_structure
+        apply_config(
+            config_view,
+            io_path=temp_io_structure,
+            repository_path=repo_path,
+            project_list_path=projects_csv_path(case['rows']),
+            n_repos=case['n_repos'],
         )
-        
-        # Mock show_info to capture the success message
-        info_shown = []
-        original_show_info = main_window.show_info
-        main_window.show_info = lambda title, msg: info_shown.append((title, msg))
-        
-        from gui.services.pipeline_service import PipelineResult
-        mock_result = PipelineResult(success=True, error_message=None)
-        
-        try:
-            with patch.object(controller, '_run_pipeline_thread') as mock_run:
-                def mock_pipeline():
-                    controller._result = mock_result
-                mock_run.side_effect = mock_pipeline
-                
-                controller._on_start_pipeline()
-                if controller._pipeline_thread:
-                    controller._pipeline_thread.join(timeout=2)
-                controller._on_pipeline_complete()
-            
-            success_shown = any(
-                title == "Success" and "Pipeline completed successfully" in msg
-                for title, msg in info_shown
-            )
-            
-            debug(f"\n[DEBUG] TF8 - Messages: {info_shown}")
-            
-            assert success_shown, f"TF8 FAILED: Pipeline not completed successfully."
-            
-            debug(f"\nTF8 PASSED: n_repos = 0 accepted, pipeline completed successfully")
-            
-        finally:
-            main_window.show_info = original_show_info
 
-    # ========================================================================
-    # TF9: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N3 - N-repos valido
-    # ========================================================================
-    def test_TF9_n_repos_valid(self, gui_components, temp_io_structure):
-        """
-        TF9: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N3
-        
-        ID: TF9
-        Combination: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N3
-        Oracle: 0 < N-repos < #CSVProjectRows - Pipeline success
-        
-        INPUT:
-        - Selected steps: Cloning + Verify
-            * run_cloner = True
-            * run_cloner_check = True
-        - IO directory: temp_io_structure - EXISTS
-        - Repo directory: temp_io_structure/repos - EXISTS
-        - CSV file: temp_io_structure/projects_TF9.csv - EXISTS, 5 data rows
-        - N-repos: 3 (0 < 3 < 5)
-        
-        EXPECTED OUTPUT:
-        - Message: "Success" / "Pipeline completed successfully!"
-        """
-        config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
-        controller = gui_components['controller']
-        
-        # Setup ST1 + CV1
-        set_cloning_steps_only(config_view, cloner=True, verify=True)
-        
-        # Setup IO1
-        config_view.io_path_var.set(str(temp_io_structure))
-        
-        # Setup RP1
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
-        
-        # Setup CSV1 + CS1: CSV with 5 data rows
-        csv_path = temp_io_structure / "projects_TF9.csv"
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])
-            for i in range(5):
-                writer.writerow([f'owner{i}', f'project{i}', f'https://github.com/owner{i}/project{i}'])
-        config_view.project_list_var.set(str(csv_path))
-        
-        # Setup N3: 0 < N-repos < #rows (5)
-        n_repos_value = 3
-        config_view.n_repos_var.set(n_repos_value)
-        
-        debug(f"\n[DEBUG] TF9 - Preconditions:")
-        debug(f"  CS1 (CSV with 5 rows): True")
-        debug(f"  N3 (0 < N-repos < 5): {config_view.n_repos_var.get()}")
-        
-        info_shown = []
-        original_show_info = main_window.show_info
-        main_window.show_info = lambda title, msg: info_shown.append((title, msg))
-        
-        from gui.services.pipeline_service import PipelineResult
-        mock_result = PipelineResult(success=True, error_message=None)
-        
-        try:
-            with patch.object(controller, '_run_pipeline_thread') as mock_run:
-                def mock_pipeline():
-                    controller._result = mock_result
-                mock_run.side_effect = mock_pipeline
-                
-                controller._on_start_pipeline()
-                if controller._pipeline_thread:
-                    controller._pipeline_thread.join(timeout=2)
-                controller._on_pipeline_complete()
-            
-            success_shown = any(
-                title == "Success" and "Pipeline completed successfully" in msg
-                for title, msg in info_shown
-            )
-            
-            debug(f"\n[DEBUG] TF9 - Messages: {info_shown}")
-            
-            assert success_shown, f"TF9 FAILED: Pipeline not completed successfully."
-            
-            debug(f"\nTF9 PASSED: Valid N-repos ({n_repos_value}) - Pipeline success")
-            
-        finally:
-            main_window.show_info = original_show_info
+        # Verify that n_repos reached the configuration unchanged
+        n_repos = config_view.get_config_values()['n_repos']
+        assert n_repos == case['n_repos'], (
+            f"{frame} FAILED: n_repos should be {case['n_repos']}.\n"
+            f"Value: {n_repos}"
+        )
 
-    # ========================================================================
-    # TF10: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N4 - N-repos > #rows
-    # ========================================================================
-    def test_TF10_n_repos_exceeds_rows(self, gui_components, temp_io_structure):
-        """
-        TF10: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N4
-        
-        ID: TF10
-        Combination: ST1 + CV1 + IO1 + RP1 + CSV1 + CS1 + N4
-        Oracle: [Error] N-repos > #CSVProjectRows
-        
-        INPUT:
-        - Selected steps: Cloning + Verify
-            * run_cloner = True
-            * run_cloner_check = True
-        - IO directory: temp_io_structure - EXISTS
-        - Repo directory: temp_io_structure/repos - EXISTS
-        - CSV file: temp_io_structure/projects_TF10.csv - EXISTS, 3 data rows
-        - N-repos: 100 (100 > 3)
-        
-        EXPECTED OUTPUT:
-        - Error: "Invalid Value" / "N-repos (100) exceeds CSV rows (3)"
-        """
-        config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
-        controller = gui_components['controller']
-        
-        # Setup ST1 + CV1
-        set_cloning_steps_only(config_view, cloner=True, verify=True)
-        
-        # Setup IO1
-        config_view.io_path_var.set(str(temp_io_structure))
-        
-        # Setup RP1
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
-        
-        # Setup CSV1 + CS1: CSV with 3 rows
-        csv_path = temp_io_structure / "projects_TF10.csv"
-        num_csv_rows = 3
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])
-            for i in range(num_csv_rows):
-                writer.writerow([f'owner{i}', f'project{i}', f'https://github.com/owner{i}/project{i}'])
-        config_view.project_list_var.set(str(csv_path))
-        
-        # Setup N4: N-repos > #rows (100 > 3)
-        n_repos_value = 100
-        config_view.n_repos_var.set(n_repos_value)
-        
-        debug(f"\n[DEBUG] TF10 - Preconditions:")
-        debug(f"  CS1 (CSV with {num_csv_rows} rows): True")
-        debug(f"  N4 (N-repos > {num_csv_rows}): {config_view.n_repos_var.get()}")
-        
-        # Mock show_error to capture the error
-        error_shown = []
-        original_show_error = main_window.show_error
-        main_window.show_error = lambda title, msg: error_shown.append((title, msg))
-        
-        try:
-            # Action: Attempt to start the pipeline
-            controller._on_start_pipeline()
-            
-            # Oracle: An error must be shown for n_repos > rows
-            assert len(error_shown) > 0, (
-                "TF10 FAILED: No error shown for n_repos > CSV rows"
+        if DEBUG:
+            debug(f"\n[DEBUG] {frame} - Preconditions:")
+            debug(f"  CS1 (CSV with {case['rows']} rows): True")
+            debug(f"  N-repos: {n_repos}")
+
+        # Dialogs recorded by the dialogs fixture
+        info_shown, error_shown = dialogs.info, dialogs.error
+
+        # Action: a mocked successful run, completed inside _on_start_pipeline()
+        controller._on_start_pipeline()
+
+        if DEBUG:
+            debug(f"\n[DEBUG] {frame} - Result:")
+            debug(f"  Info messages: {info_shown}")
+            debug(f"  Error messages: {error_shown}")
+
+        expected_error = case['error']
+        if expected_error is None:
+            assert_pipeline_success(info_shown, frame)
+        else:
+            # Oracle: the configuration is rejected before any pipeline thread exists
+            assert not sync_pipeline and controller._pipeline_thread is None, (
+                f"{frame} FAILED: pipeline thread created for n_repos = {n_repos}"
             )
-            
+            assert len(error_shown) > 0, f"{frame} FAILED: No error shown"
             error_title, error_msg = error_shown[0]
-            expected_title = "Invalid Value"
-            expected_msg = f"N-repos ({n_repos_value}) exceeds CSV rows ({num_csv_rows})"
-            
-            debug(f"\n[DEBUG] TF10 - Result:")
-            debug(f"  Error title: {error_title}")
-            debug(f"  Error message: {error_msg}")
-            
-            assert error_title == expected_title, (
-                f"TF10 FAILED: Unexpected error title.\n"
-                f"  Expected: '{expected_title}'\n"
-                f"  Actual: '{error_title}'"
+            assert (error_title, error_msg) == ("Invalid Value", expected_error), (
+                f"{frame} FAILED: Unexpected error.\n"
+                f"  Expected: 'Invalid Value' / '{expected_error}'\n"
+                f"  Actual: '{error_title}' / '{error_msg}'"
             )
-            assert error_msg == expected_msg, (
-                f"TF10 FAILED: Unexpected error message.\n"
-                f"  Expected: '{expected_msg}'\n"
-                f"  Actual: '{error_msg}'"
-            )
-            
-            debug(f"\nTF10 PASSED: Error correctly shown for n_repos > CSV rows")
-            
-        finally:
-            main_window.show_error = original_show_error
+
+        if DEBUG:
+            debug(f"\n{frame} PASSED")
 
     # ========================================================================
     # TF11: ST1 + CV2 + IO1 + RP1 - Cloning/Verify not selected
     # ========================================================================
-    def test_TF11_no_cloning_verify(self, gui_components, temp_io_structure):
+    def test_TF11_no_cloning_verify(
+        self, sync_pipeline, mock_pipeline_success, dialogs, gui_components,
+        temp_io_structure
+    ):
         """
         TF11: ST1 + CV2 + IO1 + RP1
         
@@ -1264,82 +818,60 @@ class TestGUISystemTestFrames:
         - CSV not required because Cloning/Verify not selected
         """
         config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
         controller = gui_components['controller']
         
         # Setup ST1 + CV2: Other steps only, NO Cloning/Verify
         set_all_steps(config_view, False)
         config_view.run_producer_var.set(True)  # Producer only
         
-        # Verify Precondition ST1
-        assert any_step_selected(config_view), "Precondition ST1 failed"
-        assert not all_steps_selected(config_view), "Precondition ST1 failed"
+        # Verify Preconditions ST1 + CV2
+        step_state = assert_step_preconditions(config_view, 'ST1', 'CV2')
+        
+        # Setup IO1 + RP1
+        repo_path = temp_io_structure / "repos"  # created by temp_io_structure
+        apply_config(config_view, io_path=temp_io_structure, repository_path=repo_path)
         
-        # Verify Precondition CV2
-        assert not cloning_verify_selected(config_view), "Precondition CV2 failed"
+        if DEBUG:
+            debug(f"\n[DEBUG] TF11 - Preconditions:")
+            debug(f"  ST1 (at least one step): {any(step_state.values())}")
+            debug(f"  CV2 (NO Cloning+Verify): "
+                  f"{not (step_state['run_cloner'] and step_state['run_cloner_check'])}")
+            debug(f"  IO1 (IO exists): {temp_io_structure.exists()}")
+            debug(f"  RP1 (repo exists): {repo_path.exists()}")
         
-        # Setup IO1
-        config_view.io_path_var.set(str(temp_io_structure))
+        info_shown = dialogs.info
         
-        # Setup RP1
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
+        # sync_pipeline: the mocked run completes inside _on_start_pipeline()
+        controller._on_start_pipeline()
         
-        debug(f"\n[DEBUG] TF11 - Preconditions:")
-        debug(f"  ST1 (at least one step): {any_step_selected(config_view)}")
-        debug(f"  CV2 (NO Cloning+Verify): {not cloning_verify_selected(config_view)}")
-        debug(f"  IO1 (IO exists): {temp_io_structure.exists()}")
-        debug(f"  RP1 (repo exists): {repo_path.exists()}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TF11 - Messages: {info_shown}")
         
-        info_shown = []
-        original_show_info = main_window.show_info
-        main_window.show_info = lambda title, msg: info_shown.append((title, msg))
+        assert_pipeline_success(info_shown, "TF11")
         
-        from gui.services.pipeline_service import PipelineResult
-        mock_result = PipelineResult(success=True, error_message=None)
+        # Verify that Cloning and Verify were NOT selected in the configuration
+        config = config_view.get_config_values()
+        assert config['run_cloner'] == False, (
+            f"TF11 FAILED: run_cloner should be False.\n"
+            f"  Actual: {config['run_cloner']}"
+        )
+        assert config['run_cloner_check'] == False, (
+            f"TF11 FAILED: run_cloner_check should be False.\n"
+            f"  Actual: {config['run_cloner_check']}"
+        )
         
-        try:
-            with patch.object(controller, '_run_pipeline_thread') as mock_run:
-                def mock_pipeline():
-                    controller._result = mock_result
-                mock_run.side_effect = mock_pipeline
-                
-                controller._on_start_pipeline()
-                if controller._pipeline_thread:
-                    controller._pipeline_thread.join(timeout=2)
-                controller._on_pipeline_complete()
-            
-            success_shown = any(
-                title == "Success" and "Pipeline completed successfully" in msg
-                for title, msg in info_shown
-            )
-            
-            debug(f"\n[DEBUG] TF11 - Messages: {info_shown}")
-            
-            assert success_shown, f"TF11 FAILED: Pipeline not completed."
-            
-            # Verify that Cloning and Verify were NOT selected in the configuration
-            config = config_view.get_config_values()
-            assert config['run_cloner'] == False, (
-                f"TF11 FAILED: run_cloner should be False.\n"
-                f"  Actual: {config['run_cloner']}"
-            )
-            assert config['run_cloner_check'] == False, (
-                f"TF11 FAILED: run_cloner_check should be False.\n"
-                f"  Actual: {config['run_cloner_check']}"
-            )
-            
+        if DEBUG:
             debug(f"  Verify CV2: run_cloner={config['run_cloner']}, run_cloner_check={config['run_cloner_check']}")
             debug(f"\nTF11 PASSED: Without Cloning+Verify, pipeline completed successfully")
-            
-        finally:
-            main_window.show_info = original_show_info
+        
 
     # ========================================================================
     # TF12: ST2 + CV1 + IO1 + RP1 + CSV1 + CS1 + N3 - all steps
     # ========================================================================
-    def test_TF12_all_steps(self, gui_components, temp_io_structure):
+    def test_TF12_all_steps(
+        self, sync_pipeline, mock_pipeline_success, dialogs, gui_components,
+        temp_io_structure, projects_csv_path
+    ):
         """
         TF12: ST2 + CV1 + IO1 + RP1 + CSV1 + CS1 + N3
         
@@ -1356,7 +888,7 @@ class TestGUISystemTestFrames:
             * run_metrics = True
         - IO directory: temp_io_structure - EXISTS
         - Repo directory: temp_io_structure/repos - EXISTS
-        - CSV file: temp_io_structure/projects_TF12.csv - EXISTS, 5 data rows
+        - CSV file: shared projects CSV (projects_csv_path) - EXISTS, 5 data rows
         - N-repos: 3 (0 < 3 < 5)
         
         EXPECTED OUTPUT:
@@ -1364,86 +896,56 @@ class TestGUISystemTestFrames:
         - Message: "Success" / "Pipeline completed successfully!"
         """
         config_view = gui_components['config_view']
-        main_window = gui_components['main_window']
         controller = gui_components['controller']
         
         # Setup ST2: all steps selected
         set_all_steps(config_view, True)
         
-        # Verify Precondition ST2
-        assert all_steps_selected(config_view), "Precondition ST2 failed"
-        
-        # Verify Precondition CV1 (implicit in ST2)
-        assert cloning_verify_selected(config_view), "Precondition CV1 failed"
-        
-        # Setup IO1
-        config_view.io_path_var.set(str(temp_io_structure))
-        
-        # Setup RP1
-        repo_path = temp_io_structure / "repos"
-        repo_path.mkdir(exist_ok=True)
-        config_view.repo_path_var.set(str(repo_path))
+        # Verify Preconditions ST2 + CV1 (CV1 is implicit in ST2)
+        step_state = assert_step_preconditions(config_view, 'ST2', 'CV1')
         
         # Setup CSV1 + CS1
-        csv_path = temp_io_structure / "projects_TF12.csv"
         num_csv_rows = 5
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['owner', 'project_name', 'url'])
-            for i in range(num_csv_rows):
-                writer.writerow([f'owner{i}', f'project{i}', f'https://github.com/owner{i}/project{i}'])
-        config_view.project_list_var.set(str(csv_path))
-        
-        # Setup N3: Valid N-repos
-        config_view.n_repos_var.set(3)
+        csv_path = projects_csv_path(num_csv_rows)
+        
+        # Setup IO1 + RP1 + CSV1 + N3 (Valid N-repos)
+        repo_path = temp_io_structure / "repos"  # created by temp_io_structure
+        apply_config(
+            config_view,
+            io_path=temp_io_structure,
+            repository_path=repo_path,
+            project_list_path=csv_path,
+            n_repos=3,
+        )
         
-        debug(f"\n[DEBUG] TF12 - Preconditions:")
-        debug(f"  ST2 (all steps): {all_steps_selected(config_view)}")
-        debug(f"  CV1 (Cloning+Verify): {cloning_verify_selected(config_view)}")
-        debug(f"  IO1 (IO exists): {temp_io_structure.exists()}")
-        debug(f"  RP1 (repo exists): {repo_path.exists()}")
-        debug(f"  CSV1+CS1 (CSV with data): True")
-        debug(f"  N3 (valid N-repos): {config_view.n_repos_var.get()}")
+        if DEBUG:
+            debug(f"\n[DEBUG] TF12 - Preconditions:")
+            debug(f"  ST2 (all steps): {all(step_state.values())}")
+            debug(f"  CV1 (Cloning+Verify): "
+                  f"{step_state['run_cloner'] and step_state['run_cloner_check']}")
+            debug(f"  IO1 (IO exists): {temp_io_structure.exists()}")
+            debug(f"  RP1 (repo exists): {repo_path.exists()}")
+            debug(f"  CSV1+CS1 (CSV with data): True")
+            debug(f"  N3 (valid N-repos): {config_view.n_repos_var.get()}")
         
-        info_shown = []
-        original_show_info = main_window.show_info
-        main_window.show_info = lambda title, msg: info_shown.append((title, msg))
+        info_shown = dialogs.info
         
-        from gui.services.pipeline_service import PipelineResult
-        mock_result = PipelineResult(success=True, error_message=None)
+        # sync_pipeline: the mocked run completes inside _on_start_pipeline()
+        controller._on_start_pipeline()
         
-        try:
-            with patch.object(controller, '_run_pipeline_thread') as mock_run:
-                def mock_pipeline():
-                    controller._result = mock_result
-                mock_run.side_effect = mock_pipeline
-                
-                controller._on_start_pipeline()
-                if controller._pipeline_thread:
-                    controller._pipeline_thread.join(timeout=2)
-                controller._on_pipeline_complete()
-            
-            success_shown = any(
-                title == "Success" and "Pipeline completed successfully" in msg
-                for title, msg in info_shown
-            )
-            
+        if DEBUG:
             debug(f"\n[DEBUG] TF12 - Messages: {info_shown}")
-            
-            assert success_shown, f"TF12 FAILED: Pipeline not completed."
-            
-            # Verify that all steps were selected
-            config = config_view.get_config_values()
-            assert config['run_cloner'], "TF12: run_cloner should be True"
-            assert config['run_cloner_check'], "TF12: run_cloner_check should be True"
-            assert config['run_producer_analysis'], "TF12: run_producer should be True"
-            assert config['run_consumer_analysis'], "TF12: run_consumer should be True"
-            assert config['run_metrics_analysis'], "TF12: run_metrics should be True"
-            
+        
+        assert_pipeline_success(info_shown, "TF12")
+        
+        # Verify that all steps were selected
+        config = config_view.get_config_values()
+        disabled = [key for key in STEP_KEYS if not config[key]]
+        assert not disabled, f"TF12: all steps should be True, disabled: {disabled}"
+        
+        if DEBUG:
             debug(f"\nTF12 PASSED: All steps executed, Analysis completed successfully")
-            
-        finally:
-            main_window.show_info = original_show_info
+        
 
 
 # ============================================================================
@@ -1454,9 +956,9 @@ class TestGUISystemTestFrames:
 class TestGUIConfigValidation:
     """Additional tests for GUI configuration validation."""
     
-    def test_step_selection_states(self, gui_components):
+    def test_step_selection_states(self, headless_config_view):
         """Verify that step selection states are correct."""
-        config_view = gui_components['config_view']
+        config_view = headless_config_view
         
         # Test ST2: all steps selected
         set_all_steps(config_view, True)
@@ -1471,9 +973,9 @@ class TestGUIConfigValidation:
         assert any_step_selected(config_view), "ST1: at least one step should be selected"
         assert not all_steps_selected(config_view), "ST1: Not all steps should be selected"
     
-    def test_cloning_verify_combinations(self, gui_components):
+    def test_cloning_verify_combinations(self, headless_config_view):
         """Verify the CV1 and CV2 combinations."""
-        config_view = gui_components['config_view']
+        config_view = headless_config_view
         
         # CV1: both selected
         set_cloning_steps_only(config_view, cloner=True, verify=True)
@@ -1483,60 +985,44 @@ class TestGUIConfigValidation:
         set_cloning_steps_only(config_view, cloner=False, verify=False)
         assert not cloning_verify_selected(config_view), "CV2: Cloning and Verify should not be selected"
     
-    def test_rules_3_toggle(self, gui_components):
-        """Verify Rule 3 toggle (RU3_0/RU3_1)."""
-        config_view = gui_components['config_view']
+    @pytest.mark.parametrize("rules_3", [True, False], ids=["RU3_1", "RU3_0"])
+    def test_rules_3_toggle(self, headless_config_view, rules_3):
+        """Verify Rule 3 toggle (RU3_1: selected, RU3_0: not selected)."""
+        config_view = headless_config_view
         
-        # RU3_1: Rule 3 selected
-        config_view.rules_3_var.set(True)
+        config_view.rules_3_var.set(rules_3)
         config = config_view.get_config_values()
-        assert config['rules_3'] == True, "RU3_1: rules_3 should be True"
-        
-        # RU3_0: Rule 3 not selected
-        config_view.rules_3_var.set(False)
-        config = config_view.get_config_values()
-        assert config['rules_3'] == False, "RU3_0: rules_3 should be False"
+        assert config['rules_3'] == rules_3, f"rules_3 should be {rules_3}"
     
-    def test_n_repos_values(self, gui_components):
-        """Verify N-repos values (N1, N2, N3, N4)."""
-        config_view = gui_components['config_view']
-        
-        # N1: negative value (boundary behavior)
-        config_view.n_repos_var.set(-1)
-        config = config_view.get_config_values()
-        assert config['n_repos'] == -1, "N1: n_repos should accept negative values for testing"
-        
-        # N2: zero value
-        config_view.n_repos_var.set(0)
-        config = config_view.get_config_values()
-        assert config['n_repos'] == 0, "N2: n_repos should be 0"
-        
-        # N3: valid positive value
-        config_view.n_repos_var.set(5)
-        config = config_view.get_config_values()
-        assert config['n_repos'] == 5, "N3: n_repos should be 5"
-        
-        # N4: large value
-        config_view.n_repos_var.set(1000)
+    @pytest.mark.parametrize(
+        "n_repos",
+        [-1, 0, 5, 1000],
+        ids=["N1", "N2", "N3", "N4"],
+    )
+    def test_n_repos_values(self, headless_config_view, n_repos):
+        """Verify N-repos values (N1, N2, N3, N4); negative values are accepted for boundary testing."""
+        config_view = headless_config_view
+        
+        config_view.n_repos_var.set(n_repos)
         config = config_view.get_config_values()
-        assert config['n_repos'] == 1000, "N4: n_repos should be 1000"
+        assert config['n_repos'] == n_repos, f"n_repos should be {n_repos}"
 
 
 class TestGUIPathConfiguration:
     """Tests for GUI path configuration."""
     
-    def test_default_path_values(self, gui_components):
+    def test_default_path_values(self, headless_config_view):
         """Verify default path values."""
-        config_view = gui_components['config_view']
+        config_view = headless_config_view
         
         # Defaults are set in the ConfigView constructor
         assert config_view.io_path_var.get() == "./io"
         assert config_view.repo_path_var.get() == "./io/repos"
         assert config_view.project_list_var.get() == "./io/applied_projects.csv"
     
-    def test_path_update(self, gui_components, tmp_path):
+    def test_path_update(self, headless_config_view, tmp_path):
         """Verify that paths can be updated."""
-        config_view = gui_components['config_view']
+        config_view = headless_config_view
         
         new_io_path = str(tmp_path / "new_io")
         new_repo_path = str(tmp_path / "new_repos")
@@ -1551,6 +1037,27 @@ class TestGUIPathConfiguration:
         assert str(config['io_path']) == new_io_path
         assert str(config['repository_path']) == new_repo_path
         assert str(config['project_list_path']) == new_csv_path
+    
+    def test_apply_config(self, headless_config_view, tmp_path):
+        """Verify that apply_config() sets several values and rejects unknown keys."""
+        config_view = headless_config_view
+        
+        apply_config(
+            config_view,
+            io_path=tmp_path / "applied_io",
+            repository_path=str(tmp_path / "applied_repos"),
+            n_repos=7,
+            rules_3=False,
+        )
+        
+        config = config_view.get_config_values()
+        assert config['io_path'] == tmp_path / "applied_io"
+        assert config['repository_path'] == tmp_path / "applied_repos"
+        assert config['n_repos'] == 7
+        assert config['rules_3'] == False
+        
+        with pytest.raises(KeyError):
+            apply_config(config_view, unknown_key=1)
 
 
 # ============================================================================
@@ -2,11 +2,6 @@ import unittest
 from unittest.mock import Mock, patch, mock_open
 import os
 import pandas as pd
-import sys
-
-# Add project root to path to resolve imports correctly
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, project_root)
 
 from modules.analyzer.ml_analyzer import MLAnalyzer
 from modules.analyzer.ml_roles import AnalyzerRole
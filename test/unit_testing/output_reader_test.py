@@ -1,13 +1,8 @@
 import unittest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import MagicMock, Mock, patch, mock_open
 from pathlib import Path
-import sys
 import os
 
-# Add project root to path to resolve imports correctly
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, project_root)
-
 from gui.services.output_reader import (
     OutputReader,
     OutputTree,
@@ -198,79 +193,43 @@ class TestOutputReaderFindCompleteAnalyses(unittest.TestCase):
         self.output_path = Path("/fake/output")
         self.reader = OutputReader(self.output_path)
 
-    def test_find_complete_analyses_no_directories(self):
+    @patch("gui.services.output_reader.os.scandir")
+    def test_find_complete_analyses_no_directories(self, mock_scandir):
         """(UT-CR3-01) Test case 6: No analysis directories → returns empty list."""
         # Arrange
-        producer_path = Mock(spec=Path)
-        producer_path.exists.return_value = False
-
-        consumer_path = Mock(spec=Path)
-        consumer_path.exists.return_value = False
-
-        metrics_path = Mock(spec=Path)
-        metrics_path.exists.return_value = False
+        mock_scandir.side_effect = FileNotFoundError
 
-        with patch.object(Path, "__truediv__") as mock_truediv:
-
-            def side_effect_truediv(other):
-                if other == "producer":
-                    return producer_path
-                elif other == "consumer":
-                    return consumer_path
-                elif other == "metrics":
-                    return metrics_path
-                return Mock(spec=Path)
-
-            mock_truediv.side_effect = side_effect_truediv
-
-            # Act
-            analyses = self.reader.find_complete_analyses()
+        # Act
+        analyses = self.reader.find_complete_analyses()
 
         # Assert
         self.assertEqual(analyses, [])
 
-    def test_find_complete_analyses_all_categories_present(self):
+    @patch("gui.services.output_reader.os.scandir")
+    def test_find_complete_analyses_all_categories_present(self, mock_scandir):
         """(UT-CR3-02) Test case 7: All categories with same analysis ID → returns that ID."""
-        # Arrange
-        producer_dir = Mock(spec=Path)
-        producer_dir.name = "producer_123"
-        producer_dir.is_dir.return_value = True
-
-        consumer_dir = Mock(spec=Path)
-        consumer_dir.name = "consumer_123"
-        consumer_dir.is_dir.return_value = True
 
-        metrics_dir = Mock(spec=Path)
-        metrics_dir.name = "metrics_123"
-        metrics_dir.is_dir.return_value = True
-
-        producer_path = Mock(spec=Path)
-        producer_path.exists.return_value = True
-        producer_path.iterdir.return_value = [producer_dir]
-
-        consumer_path = Mock(spec=Path)
-        consumer_path.exists.return_value = True
-        consumer_path.iterdir.return_value = [consumer_dir]
-
-        metrics_path = Mock(spec=Path)
-        metrics_path.exists.return_value = True
-        metrics_path.iterdir.return_value = [metrics_dir]
+        # Arrange
+        def make_entry(name):
+            entry = Mock(spec=os.DirEntry)
+            entry.name = name
+            return entry
 
-        with patch.object(Path, "__truediv__") as mock_truediv:
+        entries = {
+            "producer": [make_entry("producer_123")],
+            "consumer": [make_entry("consumer_123")],
+            "metrics": [make_entry("metrics_123")],
+        }
 
-            def side_effect_truediv(other):
-                if other == "producer":
-                    return producer_path
-                elif other == "consumer":
-                    return consumer_path
-                elif other == "metrics":
-                    return metrics_path
-                return Mock(spec=Path)
+        def side_effect_scandir(path):
+            listing = MagicMock()
+            listing.__enter__.return_value = entries[Path(path).name]
+            return listing
 
-            mock_truediv.side_effect = side_effect_truediv
+        mock_scandir.side_effect = side_effect_scandir
 
-            # Act
-            analyses = self.reader.find_complete_analyses()
+        # Act
+        analyses = self.reader.find_complete_analyses()
 
         # Assert
         self.assertEqual(analyses, ["123"])
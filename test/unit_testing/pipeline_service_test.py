@@ -1,13 +1,7 @@
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
 from pathlib import Path
 
-# Add project root to path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, project_root)
-
 from gui.services.pipeline_service import (
     PipelineService,
     PipelineConfig,